@@ -4,7 +4,6 @@
 """
 
 import sys
-import os
 import asyncio
 from typing import List, Dict, Any
 from loguru import logger
@@ -19,12 +18,6 @@ __description__ = "通用热榜内容爬虫包，支持知乎、微博、微信
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
-# 添加当前目录到Python路径，确保可以导入模块
-_current_dir = os.path.dirname(os.path.abspath(__file__))
-_parent_dir = os.path.dirname(_current_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
-
 try:
     from .crawler import Crawler
     from .config import CrawlerConfig
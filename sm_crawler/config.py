@@ -10,6 +10,10 @@ class CrawlerConfig:
         playwright_timeout: int = 30000,
         user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         max_answers: int = 3,
+        max_concurrent_fetches: int = 8,
+        max_fetches_per_host: int = 2,
+        min_host_interval: float = 1.0,
+        io_workers: int = 8,
     ):
         self.download_dir = download_dir
         self.max_image_size = max_image_size
@@ -17,6 +21,10 @@ class CrawlerConfig:
         self.playwright_timeout = playwright_timeout
         self.user_agent = user_agent
         self.max_answers = max_answers
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self.max_fetches_per_host = max_fetches_per_host
+        self.min_host_interval = min_host_interval
+        self.io_workers = io_workers
 
         self.platforms: Dict[str, Dict[str, Any]] = {
             "zhihu": {
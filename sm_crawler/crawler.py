@@ -1,39 +1,236 @@
 import os
+import shutil
+import sys
 import asyncio
+import threading
+import httpx
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from loguru import logger
 from pathlib import Path
-from typing import Optional, List
-from urllib.parse import urlparse
+from typing import Any, DefaultDict, Dict, NamedTuple, Optional, List, Set
+from urllib.parse import urlsplit
 
+from . import providers
 from .config import CrawlerConfig
-from .storage import StorageManager
+from .providers.base import BaseProvider
+from .storage import StorageManager, current_base_dir, purge_json_cache
+from .utils.browser_utils import browser_pool
 
-from .providers.zhihu import ZhihuArticleProvider
-from .providers.weibo import WeiboProvider
-from .providers.weixin import WeixinMpProvider
-from .providers.bilibili import BilibiliVideoProvider, BilibiliVideoQuality
-from .providers.xhs import XiaohongshuProvider
-from .providers.douyin import DouyinVideoProvider
+# Linux/macOS 下 Crawler 的私有事件循环优先使用 uvloop（可选依赖）；不修改全局事件循环策略
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+# 小红书关键词搜索的伪 URL 前缀，如 "xhs_keyword:咖啡"
+_XHS_KEYWORD_PREFIX = "xhs_keyword:"
+
+
+def _no_cookie_jar() -> CookieJar:
+    """不保存任何 Set-Cookie 的 CookieJar：共享客户端跨平台、跨抓取复用，Cookie 只能按请求传入"""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+class _HostLimiter:
+    """单个站点的限流器：限制并发数，并保证相邻两次请求的启动间隔"""
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+        self._min_interval = min_interval
+        self._last_start = float("-inf")
+
+    async def __aenter__(self):
+        await self._sem.acquire()
+        try:
+            async with self._lock:
+                loop = asyncio.get_running_loop()
+                delay = self._last_start + self._min_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._last_start = loop.time()
+        except BaseException:
+            self._sem.release()
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._sem.release()
+
+
+class _ProviderSpec(NamedTuple):
+    """平台 Provider 的构造描述"""
+
+    class_name: str
+    shared_http: bool = False  # 是否注入 Crawler 的共享 httpx.Client
+    shared_async_http: bool = False  # 是否注入 Crawler 的共享 httpx.AsyncClient
+    extra_kwargs: Dict[str, Any] = {}
+
+
+# 平台 -> Provider 分发表（小红书流程特殊，单独处理）
+_PROVIDER_SPECS: Dict[str, _ProviderSpec] = {
+    "zhihu": _ProviderSpec("ZhihuArticleProvider", shared_http=True),
+    "weibo": _ProviderSpec("WeiboProvider", shared_http=True),
+    "weixin": _ProviderSpec("WeixinMpProvider", shared_http=True, shared_async_http=True),
+    # video_quality 使用 Provider 默认的 1080P
+    "bilibili": _ProviderSpec(
+        "BilibiliVideoProvider", shared_async_http=True, extra_kwargs={"auto_download_video": True}
+    ),
+    # 下载器按 Cookie 缓存在常驻循环上复用，Crawler.close() 时统一关闭
+    "douyin": _ProviderSpec(
+        "DouyinVideoProvider", extra_kwargs={"auto_download_video": True, "shared_downloader": True}
+    ),
+}
 
 
 class Crawler:
     def __init__(self, config: Optional[CrawlerConfig] = None):
         self.config = config or CrawlerConfig()
         self.storage = StorageManager(self.config)
+        self._http_client: Optional[httpx.Client] = None
+        self._async_http_client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # 域名表在构造时固定，之后修改 config.platforms 不会生效；批量抓取时同一主机只解析一次
+        self._domain_to_platform = self._build_domain_index()
+        self._prepared_dirs: Set[str] = set()
+        self._platform_for_host = lru_cache(maxsize=4096)(self._lookup_host_platform)
         self._ensure_directories()
 
+    def _build_domain_index(self) -> Dict[str, str]:
+        """将各平台域名展开为 域名 -> 平台 的查找表"""
+        index: Dict[str, str] = {}
+        for platform, config in self.config.platforms.items():
+            for domain in config["domains"]:
+                index.setdefault(domain.lower(), platform)
+        return index
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """懒加载共享线程池，承载 Provider 中的同步 Playwright 与阻塞文件操作"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.io_workers, thread_name_prefix="sm-crawler-io"
+                )
+            return self._executor
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """懒启动常驻后台线程的事件循环，避免每次 fetch 都创建/销毁事件循环"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = _new_event_loop()
+                # Provider 通过 asyncio.to_thread 使用循环的默认执行器，即共享线程池
+                self._loop.set_default_executor(self._get_executor())
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="sm-crawler-loop", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def _run(self, coro):
+        """在常驻事件循环上执行协程并同步等待结果"""
+        loop = self._get_loop()
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("不能在 Crawler 的事件循环线程内同步调用，请改用 afetch / afetch_many")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _arun(self, coro):
+        """在常驻事件循环上执行协程，供已处于事件循环中的调用方 await，不阻塞调用方的循环"""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._get_loop()))
+
+    def _get_http_client(self) -> httpx.Client:
+        """懒加载共享的同步 HTTP 客户端，供各 Provider 下载图片/视频时复用连接池"""
+        if self._http_client is None:
+            # 图片 CDN 支持 HTTP/2 时同一文章的多张图片复用一条连接
+            self._http_client = httpx.Client(
+                http2=True,
+                cookies=_no_cookie_jar(),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=75.0),
+            )
+        return self._http_client
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """懒加载共享的异步 HTTP 客户端，仅在常驻事件循环上使用"""
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                http2=True,
+                cookies=_no_cookie_jar(),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+            )
+        return self._async_http_client
+
+    async def _aclose_loop_resources(self):
+        """释放绑定在常驻事件循环上的资源（某一项失败不影响其余资源的释放）"""
+        try:
+            await browser_pool.close()
+        finally:
+            try:
+                # 抖音下载器按 Cookie 缓存在本循环上，只有加载过抖音 Provider 时才需要关闭
+                douyin = sys.modules.get(f"{providers.__name__}.douyin")
+                if douyin is not None:
+                    await douyin.shutdown_downloaders()
+            finally:
+                client, self._async_http_client = self._async_http_client, None
+                if client is not None:
+                    await client.aclose()
+
+    def close(self):
+        """释放 Crawler 持有的共享资源"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        try:
+            if loop is not None:
+                try:
+                    # 共享浏览器与异步客户端绑定在该事件循环上，需在停止循环前释放；并发抓取期间不能逐次关闭
+                    asyncio.run_coroutine_threadsafe(self._aclose_loop_resources(), loop).result()
+                finally:
+                    # 即使释放失败（如浏览器已崩溃）也要停止并回收循环线程
+                    loop.call_soon_threadsafe(loop.stop)
+                    thread.join()
+                    loop.close()
+        finally:
+            with self._executor_lock:
+                executor = self._executor
+                self._executor = None
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _ensure_directories(self):
         os.makedirs(self.config.download_dir, exist_ok=True)
 
     def _identify_platform(self, url: str) -> Optional[str]:
-        if url.startswith("xhs_keyword:"):
+        if url.startswith(_XHS_KEYWORD_PREFIX):
             return "xiaohongshu"
 
-        domain = urlparse(url).netloc
+        return self._platform_for_host(urlsplit(url).hostname or "")
 
-        for platform, config in self.config.platforms.items():
-            if any(d in domain for d in config["domains"]):
+    def _lookup_host_platform(self, host: str) -> Optional[str]:
+        """从完整主机名开始逐级去掉最左侧标签做后缀匹配，如 m.weibo.com -> weibo.com"""
+        while host:
+            platform = self._domain_to_platform.get(host)
+            if platform:
                 return platform
+            _, _, host = host.partition(".")
         return None
 
     def fetch(
@@ -52,142 +249,182 @@ class Crawler:
         Returns:
             抓取是否成功 (bool)
         """
+        return self._run(self._fetch_async(url, destination, cookies))
+
+    def fetch_many(
+        self,
+        urls: List[str],
+        destination: Optional[str] = None,
+        cookies: Optional[List[dict]] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[bool]:
+        """并发抓取多个 URL。
+
+        Args:
+            urls(List[str]): 需要抓取的链接列表
+            destination(Optional[str]): 可选的目标保存目录，若未指定则使用默认下载目录
+            cookies(Optional[List[Dict]]): 可选的 cookies 列表，所有链接共用
+            concurrency(Optional[int]): 最大并发数，默认取 config.max_concurrent_fetches
+
+        Returns:
+            与 urls 一一对应的抓取结果列表 (List[bool])
+        """
+        return self._run(self._fetch_many_async(urls, destination, cookies, concurrency))
+
+    async def afetch(
+        self,
+        url: str,
+        destination: Optional[str] = None,
+        cookies: Optional[List[dict]] = None,
+    ) -> bool:
+        """fetch 的异步版本，适用于已运行事件循环的调用方（如 FastAPI 接口）"""
+        return await self._arun(self._fetch_async(url, destination, cookies))
+
+    async def afetch_many(
+        self,
+        urls: List[str],
+        destination: Optional[str] = None,
+        cookies: Optional[List[dict]] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[bool]:
+        """fetch_many 的异步版本，适用于已运行事件循环的调用方"""
+        return await self._arun(self._fetch_many_async(urls, destination, cookies, concurrency))
+
+    async def _fetch_many_async(
+        self,
+        urls: List[str],
+        destination: Optional[str],
+        cookies: Optional[List[dict]],
+        concurrency: Optional[int],
+    ) -> List[bool]:
+        sem = asyncio.Semaphore(concurrency or self.config.max_concurrent_fetches)
+        # 同一站点单独限流，避免批量请求集中打到一个平台；不同站点互不影响
+        host_limiters: DefaultDict[str, _HostLimiter] = defaultdict(
+            lambda: _HostLimiter(self.config.max_fetches_per_host, self.config.min_host_interval)
+        )
+
+        async def _one(u: str) -> bool:
+            host = urlsplit(u).hostname or u.split(":", 1)[0]
+            # 先过站点限流再占用全局名额，避免排队等待的任务占着全局并发
+            async with host_limiters[host], sem:
+                return await self._fetch_async(u, destination, cookies)
+
+        # 重复链接只抓取一次，结果按原顺序回填
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*[_one(u) for u in unique_urls], return_exceptions=True)
+        success = {u: r is True for u, r in zip(unique_urls, results)}
+        return [success[u] for u in urls]
+
+    def _build_provider(self, platform: str, url: str, cookies: Optional[List[dict]]) -> Optional[BaseProvider]:
+        """按分发表构造 Provider，Provider 类在首次使用时才导入"""
+        spec = _PROVIDER_SPECS.get(platform)
+        if spec is None:
+            return None
+
+        provider_cls = getattr(providers, spec.class_name)
+        kwargs = dict(spec.extra_kwargs)
+        if spec.shared_http:
+            kwargs["http_client"] = self._get_http_client()
+        if spec.shared_async_http:
+            kwargs["async_http_client"] = self._get_async_http_client()
+        return provider_cls(url=url, config=self.config, cookies=cookies, force_save=True, **kwargs)
+
+    async def _fetch_xhs(self, url: str, cookies: Optional[List[dict]], dest_dir: str, log=logger) -> bool:
+        """小红书走独立的关键词搜索 / 笔记详情流程"""
+        if url.startswith(_XHS_KEYWORD_PREFIX):
+            keyword = url[len(_XHS_KEYWORD_PREFIX) :].strip()
+            if not keyword:
+                log.error(f"❌ 小红书关键词不能为空")
+                return False
+
+            if cookies is None:
+                log.error(f"❌ 小红书搜索需要有效的cookies，请提供cookies参数")
+                return False
+
+            provider = providers.XiaohongshuProvider(
+                cookies=cookies, save_dir=dest_dir, async_http_client=self._get_async_http_client()
+            )
+            result = await provider.search_and_save(
+                query=keyword,
+                require_num=2,
+                save_format="both",
+                custom_save_dir=dest_dir,
+            )
+            await provider.close()
+
+            if result.get("success"):
+                log.info(
+                    f"✅ 小红书搜索成功: {keyword}，找到 {result['total_found']} 个笔记，"
+                    f"保存 {result['saved']} 个 -> {result['save_directory']}"
+                )
+                return True
+            else:
+                error_msg = result.get("error") or result.get("statistics", {}).get("error", "未知错误")
+                log.error(f"❌ 小红书搜索失败: {error_msg}")
+                return False
+
+        provider = providers.XiaohongshuProvider(
+            cookies=cookies, save_dir=dest_dir, async_http_client=self._get_async_http_client()
+        )
+        result = await provider.get_note_detail_and_save(
+            url=url,
+            save_format="both",
+            custom_save_dir=dest_dir,
+        )
+        await provider.close()
+
+        if result.get("success"):
+            log.info(f"✅ 小红书笔记获取成功: {url} -> {dest_dir}")
+            return True
+        else:
+            log.error(f"❌ 小红书笔记获取失败: {result.get('error', '未知错误')}")
+            return False
+
+    async def _fetch_async(
+        self,
+        url: str,
+        destination: Optional[str] = None,
+        cookies: Optional[List[dict]] = None,
+    ) -> bool:
         try:
             platform = self._identify_platform(url)
             if not platform:
                 logger.error(f"❌ 无法识别平台: {url}")
                 return False
 
-            logger.info(f"🎯 识别平台: {platform}")
+            dest_dir = await self._prepare_destination(destination or self.config.download_dir)
+            # 每次抓取只输出一条带上下文字段的结果日志，减少并发时的日志开销
+            log = logger.bind(platform=platform, url=url, destination=dest_dir)
 
-            dest_dir = destination or self.config.download_dir
-            dest_dir = os.path.abspath(dest_dir)
-            os.makedirs(dest_dir, exist_ok=True)
-            logger.info(f"📁 目标目录: {dest_dir}")
+            # 通过 ContextVar 把目标目录传给本次抓取内的所有 StorageManager，并发任务互不干扰
+            token = current_base_dir.set(dest_dir)
 
-            original_base_dir = self.storage.base_dir
-            self.storage.base_dir = dest_dir
+            try:
+                if platform == "xiaohongshu":
+                    return await self._fetch_xhs(url, cookies, dest_dir, log)
 
-            provider = None
-            result = None
+                provider = self._build_provider(platform, url, cookies)
+                if provider is None:
+                    log.error(f"❌ 不支持的平台: {platform}")
+                    return False
 
-            try:
-                if platform == "zhihu":
-                    provider = ZhihuArticleProvider(
-                        url=url,
-                        config=self.config,
-                        cookies=cookies,
-                        force_save=True,
-                    )
-                elif platform == "weibo":
-                    provider = WeiboProvider(
-                        url=url,
-                        config=self.config,
-                        cookies=cookies,
-                        force_save=True,
-                    )
-                elif platform == "weixin":
-                    provider = WeixinMpProvider(
-                        url=url,
-                        config=self.config,
-                        cookies=cookies,
-                        force_save=True,
-                    )
-                elif platform == "bilibili":
-                    provider = BilibiliVideoProvider(
-                        url=url,
-                        config=self.config,
-                        force_save=True,
-                        cookies=cookies,
-                        auto_download_video=True,
-                        video_quality=BilibiliVideoQuality.QUALITY_1080P,
-                    )
-                elif platform == "douyin":
-                    provider = DouyinVideoProvider(
-                        url=url,
-                        config=self.config,
-                        cookies=cookies,
-                        force_save=True,
-                        auto_download_video=True,
-                    )
-                elif platform == "xiaohongshu":
-                    if url.startswith("xhs_keyword:"):
-                        keyword = url.replace("xhs_keyword:", "").strip()
-                        if not keyword:
-                            logger.error(f"❌ 小红书关键词不能为空")
-                            return False
-
-                        logger.debug(f"🔍 小红书关键词搜索: {keyword}")
-                        if cookies is None:
-                            logger.error(f"❌ 小红书搜索需要有效的cookies，请提供cookies参数")
-                            return False
-
-                        provider = XiaohongshuProvider(cookies=cookies, save_dir=dest_dir)
-
-                        async def _run_xhs_search():
-                            search_result = await provider.search_and_save(
-                                query=keyword,
-                                require_num=2,
-                                save_format="both",
-                                custom_save_dir=dest_dir,
-                            )
-                            await provider.close()
-                            return search_result
-
-                        result = asyncio.run(_run_xhs_search())
-
-                        if result.get("success"):
-                            logger.info(f"✅ 小红书搜索成功！")
-                            logger.debug(f"📊 找到 {result['total_found']} 个笔记")
-                            logger.info(f"💾 成功保存 {result['saved']} 个笔记")
-                            logger.info(f"📂 保存位置: {result['save_directory']}")
-                            return True
-                        else:
-                            error_msg = result.get("error") or result.get("statistics", {}).get("error", "未知错误")
-                            logger.error(f"❌ 小红书搜索失败: {error_msg}")
-                            return False
-                    else:
-                        provider = XiaohongshuProvider(cookies=cookies, save_dir=dest_dir)
-
-                        async def _run_xhs_detail():
-                            detail_result = await provider.get_note_detail_and_save(
-                                url=url,
-                                save_format="both",
-                                custom_save_dir=dest_dir,
-                            )
-                            await provider.close()
-                            return detail_result
-
-                        result = asyncio.run(_run_xhs_detail())
-
-                        if result.get("success"):
-                            logger.info(f"✅ 小红书笔记获取成功！")
-                            return True
-                        else:
-                            logger.error(f"❌ 小红书笔记获取失败: {result.get('error', '未知错误')}")
-                            return False
+                try:
+                    result = await provider.fetch_and_parse()
+                finally:
+                    # 部分 Provider（如抖音）需要归还共享资源
+                    close = getattr(provider, "close", None)
+                    if close is not None:
+                        await close()
+
+                if result:
+                    log.info(f"✅ [{platform}] 内容获取成功: {url} -> {dest_dir}")
+                    return True
                 else:
-                    logger.error(f"❌ 不支持的平台: {platform}")
+                    log.error(f"❌ [{platform}] 内容获取失败: {url}")
                     return False
 
-                if provider and not result:
-
-                    async def _run_fetch():
-                        return await provider.fetch_and_parse()
-
-                    result = asyncio.run(_run_fetch())
-
-                    if result:
-                        logger.info(f"✅ 内容获取成功！")
-                        return True
-                    else:
-                        logger.error(f"❌ 内容获取失败")
-                        return False
-
-                return result is not None
-
             finally:
-                self.storage.base_dir = original_base_dir
+                current_base_dir.reset(token)
 
         except Exception as e:
             logger.error(f"❌ fetch 执行失败: {e}")
@@ -196,20 +433,48 @@ class Crawler:
             logger.debug(traceback.format_exc())
             return False
 
+    async def _prepare_destination(self, destination: str) -> str:
+        """返回目标目录的绝对路径，同一目录只创建一次（makedirs 放到线程池，避免慢盘阻塞事件循环）"""
+        dest_dir = os.path.abspath(destination)
+        if dest_dir not in self._prepared_dirs:
+            await asyncio.to_thread(os.makedirs, dest_dir, exist_ok=True)
+            self._prepared_dirs.add(dest_dir)
+        return dest_dir
+
+    def _cache_target(self, platform: Optional[str]) -> Path:
+        """返回需要清理的缓存目录：指定平台目录或整个下载目录"""
+        download_dir = Path(self.config.download_dir)
+        return download_dir / platform if platform else download_dir
+
+    def _submit_rmtree(self, path: Path) -> List[Future]:
+        """清空目录：顶层文件直接删除，每个子目录作为一个任务并行交给共享线程池"""
+        executor = self._get_executor()
+        futures = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    futures.append(executor.submit(shutil.rmtree, entry.path))
+                else:
+                    os.unlink(entry.path)
+        return futures
+
     def clear_cache(self, platform: Optional[str] = None):
         """清除指定平台或所有平台的缓存。"""
-        if platform:
-            platform_dir = Path(self.config.download_dir) / platform
-            if platform_dir.exists():
-                import shutil
+        self._prepared_dirs.clear()
+        target = self._cache_target(platform)
+        purge_json_cache(str(target))
+        if target.exists():
+            for future in self._submit_rmtree(target):
+                future.result()
+            if platform:
+                target.rmdir()
 
-                shutil.rmtree(platform_dir)
-                logger.info(f"✅ 已清除 {platform} 缓存")
+        if platform:
+            logger.info(f"✅ 已清除 {platform} 缓存")
         else:
-            download_dir = Path(self.config.download_dir)
-            if download_dir.exists():
-                import shutil
-
-                shutil.rmtree(download_dir)
-            download_dir.mkdir(parents=True, exist_ok=True)
+            target.mkdir(parents=True, exist_ok=True)
             logger.info(f"✅ 已清除所有缓存")
+
+    async def aclear_cache(self, platform: Optional[str] = None):
+        """clear_cache 的异步版本：整个清理过程（含 scandir/unlink/rmdir）放到调用方循环的线程池执行，不阻塞事件循环"""
+        await asyncio.to_thread(self.clear_cache, platform)
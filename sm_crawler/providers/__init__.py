@@ -1,9 +1,14 @@
-from sm_crawler.providers.zhihu import ZhihuArticleProvider
-from sm_crawler.providers.weixin import WeixinMpProvider
-from sm_crawler.providers.weibo import WeiboProvider
-from sm_crawler.providers.bilibili import BilibiliVideoProvider
-from sm_crawler.providers.douyin import DouyinVideoProvider
-from sm_crawler.providers.xhs import XiaohongshuProvider
+import importlib
+
+# 各 Provider 依赖较重（Playwright、BeautifulSoup、JS 运行时等），按需在首次访问时导入
+_PROVIDER_MODULES = {
+    "ZhihuArticleProvider": "zhihu",
+    "WeixinMpProvider": "weixin",
+    "WeiboProvider": "weibo",
+    "BilibiliVideoProvider": "bilibili",
+    "DouyinVideoProvider": "douyin",
+    "XiaohongshuProvider": "xhs",
+}
 
 __all__ = [
     "ZhihuArticleProvider",
@@ -13,3 +18,16 @@ __all__ = [
     "DouyinVideoProvider",
     "XiaohongshuProvider",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_cls = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = provider_cls
+    return provider_cls
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import httpx
 
 from ..storage import StorageManager
 
@@ -15,6 +18,8 @@ class BaseProvider(ABC):
         config: Any,
         force_save: bool = True,
         platform_name: str = "unknown",
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.url = url
         self.config = config
@@ -29,6 +34,24 @@ class BaseProvider(ABC):
         # 实例化 StorageManager（如果 config 存在）
         self.storage = StorageManager(config) if config else None
 
+        # 由 Crawler 注入的共享 HTTP 客户端，跨次抓取复用 TCP/TLS 连接
+        self.http_client = http_client
+        self.async_http_client = async_http_client
+
+    @property
+    def http(self) -> Any:
+        """同步 HTTP 请求入口：未注入共享客户端时退回 httpx 模块级函数（get/stream 签名一致）"""
+        return self.http_client if self.http_client is not None else httpx
+
+    @asynccontextmanager
+    async def async_http(self) -> AsyncIterator[httpx.AsyncClient]:
+        """异步 HTTP 客户端：优先复用注入的共享客户端，否则临时创建（请求头/超时按请求传入）"""
+        if self.async_http_client is not None:
+            yield self.async_http_client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
+
     @abstractmethod
     async def fetch_and_parse(self) -> Any:
         """
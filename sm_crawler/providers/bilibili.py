@@ -4,7 +4,6 @@ B站视频Provider - 支持获取视频信息和下载链接
 
 import os
 import re
-import json
 import httpx
 from enum import Enum
 from typing import Any, Dict, Optional
@@ -13,7 +12,7 @@ from loguru import logger
 
 from ..providers.base import BaseProvider
 from ..models import ScrapedDataItem
-from ..utils.file_utils import format_cookies_to_string
+from ..utils.file_utils import format_cookies_to_string, write_json_file
 
 
 class BilibiliVideoEndpoints(Enum):
@@ -58,6 +57,7 @@ class BilibiliVideoProvider(BaseProvider):
         force_save: bool = True,
         auto_download_video: bool = False,
         video_quality: BilibiliVideoQuality = BilibiliVideoQuality.QUALITY_1080P,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         初始化B站视频Provider
@@ -69,8 +69,9 @@ class BilibiliVideoProvider(BaseProvider):
             cookies: B站登录cookie（获取高清画质需要）
             auto_download_video: 是否自动下载视频文件
             video_quality: 视频清晰度（使用 BilibiliVideoQuality 枚举）
+            async_http_client: 可选的共享 httpx.AsyncClient
         """
-        super().__init__(url, config, force_save, "bilibili")
+        super().__init__(url, config, force_save, "bilibili", async_http_client=async_http_client)
         self.cookies = format_cookies_to_string(cookies)
         self.bvid: Optional[str] = None
         self.aid: Optional[str] = None
@@ -135,9 +136,9 @@ class BilibiliVideoProvider(BaseProvider):
         if self.cookies:
             headers["Cookie"] = self.cookies
 
-        async with httpx.AsyncClient(follow_redirects=True, headers=headers, timeout=30.0) as client:
+        async with self.async_http() as client:
             try:
-                response = await client.get(endpoint)
+                response = await client.get(endpoint, headers=headers, follow_redirects=True, timeout=30.0)
                 response.raise_for_status()
                 return response.json()
             except Exception as e:
@@ -276,8 +277,7 @@ class BilibiliVideoProvider(BaseProvider):
 
                 # 保存JSON格式的完整数据
                 json_path = os.path.join(storage_info["article_dir"], "video_info.json")
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(video_info, f, ensure_ascii=False, indent=2)
+                write_json_file(json_path, video_info)
 
                 # 保存文本内容
                 self.storage.save_text_content(storage_info, content_text)
@@ -646,8 +646,8 @@ class BilibiliVideoProvider(BaseProvider):
         if self.cookies:
             headers["Cookie"] = self.cookies
 
-        async with httpx.AsyncClient(follow_redirects=True, headers=headers, timeout=300.0) as client:
-            async with client.stream("GET", url) as response:
+        async with self.async_http() as client:
+            async with client.stream("GET", url, headers=headers, follow_redirects=True, timeout=300.0) as response:
                 response.raise_for_status()
 
                 total_size = int(response.headers.get("content-length", 0))
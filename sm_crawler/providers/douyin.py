@@ -1,17 +1,126 @@
 import re
 import os
-import json
 import asyncio
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from loguru import logger
-from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Tuple, Union
 from datetime import datetime
-from playwright.async_api import async_playwright
+from urllib.parse import urlsplit
 
 from .base import BaseProvider
 from ..models import ScrapedDataItem
 from ..utils.dy import DouyinVideoDownloader
-from ..utils.file_utils import get_random_user_agent, format_cookies_to_string
+from ..utils.browser_utils import browser_pool
+from ..utils.file_utils import get_random_user_agent, format_cookies_to_string, write_json_file
+
+_DOUYIN_HOST_SUFFIX = "douyin.com"  # 同时覆盖 www./v. 子域和 iesdouyin.com
+# 用户主页链接；/user/self 是当前登录用户自己的主页入口，不是视频作者
+_USER_URL_RE = re.compile(r"www\.douyin\.com/user/(?!self\b)([A-Za-z0-9_-]+)")
+# 页面内嵌数据中的作者 sec_uid
+_AUTHOR_SEC_ID_RE = re.compile(r'"(?:authorSecId|sec_uid)"\s*:\s*"([A-Za-z0-9_-]+)"')
+_VIDEO_ID_RE = re.compile(r"/video/(\d+)")
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# 短链/不完整链接 -> 完整链接 的解析结果缓存（同一视频的作者不会变），超出上限时淘汰最久未用的
+_COMPLETE_URL_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_COMPLETE_URL_CACHE_SIZE = 1024
+
+# (事件循环, Cookie) -> 下载器；httpx.AsyncClient 绑定创建它的事件循环，不能跨循环复用。
+# 只有 Crawler 托管的 Provider 使用，超出上限时淘汰最久未用的
+_DOWNLOADER_CACHE: "OrderedDict[Tuple[asyncio.AbstractEventLoop, str], DouyinVideoDownloader]" = OrderedDict()
+_DOWNLOADER_CACHE_SIZE = 16
+# 共享下载器 -> 正在使用它的 Provider 数；被淘汰的下载器等最后一个使用者释放后再关闭
+_DOWNLOADER_USERS: Dict[DouyinVideoDownloader, int] = {}
+# 多个 Crawler 的常驻循环在不同线程上，会同时访问上面两个表
+_DOWNLOADER_LOCK = threading.Lock()
+# 淘汰时在当前循环上发起的关闭任务，保留引用以免被垃圾回收
+_CLOSING_TASKS: Set["asyncio.Task"] = set()
+
+# 页面中的用户主页链接（JS 正则字面量）；等待与提取共用，保证等到的链接一定能被提取出来
+_USER_LINK_JS_RE = r"/https:\/\/www\.douyin\.com\/user\/(?!self\b)([A-Za-z0-9_-]+)/"
+_USER_LINK_READY_JS = f"() => {_USER_LINK_JS_RE}.test(document.documentElement.innerHTML)"
+_EXTRACT_USER_ID_JS = f"""() => {{
+    const m = document.documentElement.innerHTML.match({_USER_LINK_JS_RE});
+    return m ? m[1] : null;
+}}"""
+
+
+def _new_downloader(cookie: str) -> DouyinVideoDownloader:
+    return DouyinVideoDownloader(cookie=cookie, user_agent=get_random_user_agent())
+
+
+def _close_evicted(loop: asyncio.AbstractEventLoop, downloader: DouyinVideoDownloader):
+    """在下载器所属的事件循环上关闭它；循环已关闭时连接无法再关闭，只能释放引用"""
+    if loop.is_closed():
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if loop is running:
+        task = loop.create_task(downloader.close())
+        _CLOSING_TASKS.add(task)
+        task.add_done_callback(_CLOSING_TASKS.discard)
+    else:
+        asyncio.run_coroutine_threadsafe(downloader.close(), loop)
+
+
+def _acquire_downloader(cookie: str) -> DouyinVideoDownloader:
+    """获取当前事件循环上该 Cookie 对应的共享下载器，并登记一个使用者"""
+    loop = asyncio.get_running_loop()
+    evicted = None
+    with _DOWNLOADER_LOCK:
+        # 已关闭循环上的下载器无法再使用，直接丢弃
+        for key in [k for k in _DOWNLOADER_CACHE if k[0].is_closed()]:
+            _DOWNLOADER_USERS.pop(_DOWNLOADER_CACHE.pop(key), None)
+
+        key = (loop, cookie)
+        downloader = _DOWNLOADER_CACHE.get(key)
+        if downloader is None:
+            downloader = _DOWNLOADER_CACHE[key] = _new_downloader(cookie)
+            if len(_DOWNLOADER_CACHE) > _DOWNLOADER_CACHE_SIZE:
+                (old_loop, _), old = _DOWNLOADER_CACHE.popitem(last=False)
+                if not _DOWNLOADER_USERS.get(old):
+                    evicted = (old_loop, old)
+        else:
+            _DOWNLOADER_CACHE.move_to_end(key)
+        _DOWNLOADER_USERS[downloader] = _DOWNLOADER_USERS.get(downloader, 0) + 1
+
+    if evicted is not None:
+        _close_evicted(*evicted)
+    return downloader
+
+
+async def _release_downloader(downloader: DouyinVideoDownloader):
+    """注销一个使用者；下载器已被淘汰且无人使用时关闭它"""
+    with _DOWNLOADER_LOCK:
+        users = _DOWNLOADER_USERS.get(downloader, 1) - 1
+        if users > 0:
+            _DOWNLOADER_USERS[downloader] = users
+            return
+        _DOWNLOADER_USERS.pop(downloader, None)
+        if any(d is downloader for d in _DOWNLOADER_CACHE.values()):
+            return
+    await downloader.close()
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(ts: int) -> str:
+    """时间戳 -> 本地时间字符串（同一作者的作品时间常重复，结果按时间戳缓存）"""
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+
+async def shutdown_downloaders():
+    """关闭当前事件循环上缓存的全部下载器"""
+    loop = asyncio.get_running_loop()
+    with _DOWNLOADER_LOCK:
+        downloaders = [_DOWNLOADER_CACHE.pop(k) for k in [k for k in _DOWNLOADER_CACHE if k[0] is loop]]
+        for downloader in downloaders:
+            _DOWNLOADER_USERS.pop(downloader, None)
+    for downloader in downloaders:
+        await downloader.close()
 
 
 class DouyinVideoProvider(BaseProvider):
@@ -33,6 +142,7 @@ class DouyinVideoProvider(BaseProvider):
         cookies: list | str | None = None,
         force_save: bool = True,
         auto_download_video: bool = False,
+        shared_downloader: bool = False,
     ):
         """
         初始化抖音视频Provider
@@ -43,18 +153,24 @@ class DouyinVideoProvider(BaseProvider):
             force_save: 是否强制保存
             cookies: Cookie字符串（可选，默认从浏览器数据加载）
             auto_download_video: 是否自动下载视频
+            shared_downloader: 是否复用当前事件循环上按 Cookie 缓存的下载器（由 Crawler 或批量抓取托管，
+                用完后统一关闭）；否则独占一个新的下载器，在 close() 中关闭
         """
         super().__init__(url, config, force_save, "douyin")
 
         self.url = url
         self.auto_download_video = auto_download_video
 
-        # 加载Cookie和User-Agent
+        # 加载Cookie
         self.cookies = format_cookies_to_string(cookies)
-        self.user_agent = get_random_user_agent()
 
-        # 初始化下载器（使用加载的Cookie和UA）
-        self.downloader = DouyinVideoDownloader(cookie=self.cookies or "", user_agent=self.user_agent)
+        # Crawler 托管时同一 Cookie 复用缓存的下载器（及其连接池），User-Agent 跟随下载器保持一致
+        self._shared_downloader = shared_downloader
+        if shared_downloader:
+            self.downloader = _acquire_downloader(self.cookies or "")
+        else:
+            self.downloader = _new_downloader(self.cookies or "")
+        self.user_agent = self.downloader.user_agent
 
     async def _get_user_id_from_browser(self, video_url: str) -> Optional[str]:
         """
@@ -69,36 +185,56 @@ class DouyinVideoProvider(BaseProvider):
         logger.debug(f"   🌐 使用浏览器获取用户ID...")
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(user_agent=self.user_agent)
-                page = await context.new_page()
-
-                try:
-                    logger.debug("   ⏳ 正在加载页面...")
-                    await page.goto(video_url, wait_until="networkidle", timeout=30000)
-                    await asyncio.sleep(3)
-
-                    html_content = await page.content()
-                    pattern = r"https://www\.douyin\.com/user/([A-Za-z0-9_-]+)"
-                    matches = re.findall(pattern, html_content)
-
-                    if matches:
-                        user_id = matches[0]
-                        logger.debug(f"   ✅ 成功获取用户ID: {user_id[:30]}...")
-                        return user_id
-                    else:
-                        logger.error("   ❌ 未在网页中找到用户ID")
-                        return None
-                except Exception as e:
-                    logger.error(f"   ❌ 获取失败: {e}")
-                    return None
-                finally:
-                    await browser.close()
+            browser = await browser_pool.get_browser()
+            context = await browser.new_context(user_agent=self.user_agent)
         except Exception as e:
             logger.error(f"   ❌ 浏览器初始化失败: {e}")
             return None
 
+        try:
+            page = await context.new_page()
+
+            logger.debug("   ⏳ 正在加载页面...")
+            # 抖音页面埋点请求不断，networkidle 常常等到超时；改为等用户主页链接出现在 DOM 中
+            await page.goto(video_url, wait_until="domcontentloaded", timeout=15000)
+            await page.wait_for_function(_USER_LINK_READY_JS, timeout=10000)
+
+            # 直接在页面里匹配，只把用户ID传回来，避免整页 HTML 经 CDP 回传再做正则
+            user_id = await page.evaluate(_EXTRACT_USER_ID_JS)
+
+            if user_id:
+                logger.debug(f"   ✅ 成功获取用户ID: {user_id[:30]}...")
+                return user_id
+            else:
+                logger.error("   ❌ 未在网页中找到用户ID")
+                return None
+        except Exception as e:
+            logger.error(f"   ❌ 获取失败: {e}")
+            return None
+        finally:
+            # 只关闭本次的上下文，浏览器留给后续调用复用
+            await context.close()
+
+    async def _probe_user_id(self, video_url: str) -> Optional[str]:
+        """
+        先用普通 HTTP 请求尝试获取用户ID（跟随重定向后的地址带有作者主页，或页面数据中带有作者 sec_uid 时无需启动浏览器）
+
+        Args:
+            video_url: 视频URL
+
+        Returns:
+            str: 用户ID，未找到返回None
+        """
+        try:
+            response = await self.downloader.client.get(video_url)
+        except Exception as e:
+            logger.debug(f"   ⚠️ HTTP 探测失败: {e}")
+            return None
+
+        # 跳转后的地址带作者主页时直接取；否则只认页面数据里的作者字段，导航栏等处的其他用户链接不可信
+        match = _USER_URL_RE.search(str(response.url)) or _AUTHOR_SEC_ID_RE.search(response.text)
+        return match.group(1) if match else None
+
     async def _build_complete_url(self, url: str) -> Optional[str]:
         """
         将不完整链接转换为完整链接
@@ -114,8 +250,14 @@ class DouyinVideoProvider(BaseProvider):
             logger.debug("   ✅ 已经是完整链接")
             return url
 
+        cached = _COMPLETE_URL_CACHE.get(url)
+        if cached is not None:
+            _COMPLETE_URL_CACHE.move_to_end(url)
+            logger.debug("   ✅ 命中完整链接缓存")
+            return cached
+
         # 提取视频ID
-        video_id_match = re.search(r"/video/(\d+)", url)
+        video_id_match = _VIDEO_ID_RE.search(url)
         if not video_id_match:
             logger.error("   ❌ 无法从链接中提取视频ID")
             return None
@@ -123,13 +265,16 @@ class DouyinVideoProvider(BaseProvider):
         video_id = video_id_match.group(1)
         logger.debug(f"   📹 视频ID: {video_id}")
 
-        # 使用浏览器获取用户ID
-        user_id = await self._get_user_id_from_browser(url)
+        # 优先用 HTTP 探测，拿不到再使用浏览器获取用户ID
+        user_id = await self._probe_user_id(url) or await self._get_user_id_from_browser(url)
         if not user_id:
             return None
 
         # 拼接完整链接
         complete_url = f"https://www.douyin.com/user/{user_id}/video/{video_id}"
+        _COMPLETE_URL_CACHE[url] = complete_url
+        if len(_COMPLETE_URL_CACHE) > _COMPLETE_URL_CACHE_SIZE:
+            _COMPLETE_URL_CACHE.popitem(last=False)
         logger.debug(f"   ✅ 完整链接: {complete_url[:80]}...")
         return complete_url
 
@@ -140,6 +285,13 @@ class DouyinVideoProvider(BaseProvider):
         Returns:
             ScrapedDataItem: 包含视频信息的数据项
         """
+        # 明显无效的链接直接失败，不进入 HTTP 探测 / 浏览器流程
+        host = urlsplit(self.url).hostname or ""
+        if not host.endswith(_DOUYIN_HOST_SUFFIX):
+            raise ValueError(f"不是抖音链接: {self.url!r}")
+        if "/user/" not in self.url and not _VIDEO_ID_RE.search(self.url):
+            raise ValueError(f"无法从链接中提取视频ID: {self.url!r}")
+
         try:
             logger.debug("\n" + "=" * 80 + "\n🎬 抖音视频Provider - 开始处理\n" + "=" * 80)
             logger.debug(f"\n📎 输入链接: {self.url}")
@@ -189,12 +341,14 @@ class DouyinVideoProvider(BaseProvider):
 
             # 5. 创建存储目录（如果需要保存）
             storage_info = None
+            article_dir = None
             if self.force_save:
                 storage_info = self.storage.create_article_storage(
                     platform=self.platform_name,
                     title=video_info.get("desc", "抖音视频"),
                     url=self.url,
                 )
+                article_dir = storage_info["article_dir"]
 
             # 6. 自动下载视频（如果启用）
             if self.auto_download_video and storage_info:
@@ -206,16 +360,14 @@ class DouyinVideoProvider(BaseProvider):
                 if not video_url:
                     logger.warning("   ⚠️ 未找到视频下载地址")
                 else:
-                    # 构造文件名
+                    # 构造文件名（描述先截断再清理非法字符）
                     author_name = video_info["author"]["nickname"]
                     desc = video_info["desc"][:30]
-
-                    # 清理文件名中的非法字符
-                    safe_author = re.sub(r'[<>:"/\\|?*]', "_", author_name)
-                    safe_desc = re.sub(r'[<>:"/\\|?*]', "_", desc)
-
-                    filename = f"{safe_author}_{aweme_id}_{safe_desc}.mp4"
-                    save_path = os.path.join(storage_info["article_dir"], filename)
+                    filename = (
+                        f"{_UNSAFE_FILENAME_RE.sub('_', author_name)}_{aweme_id}_"
+                        f"{_UNSAFE_FILENAME_RE.sub('_', desc)}.mp4"
+                    )
+                    save_path = os.path.join(article_dir, filename)
 
                     # 下载视频
                     success = await self.downloader.download_video(video_url, save_path)
@@ -223,7 +375,7 @@ class DouyinVideoProvider(BaseProvider):
                     if success:
                         video_info["local_video_path"] = save_path
                         # 获取文件大小
-                        file_size = Path(save_path).stat().st_size / (1024 * 1024)
+                        file_size = os.path.getsize(save_path) / (1024 * 1024)
                         logger.info(f"   文件大小: {file_size:.2f} MB")
                     else:
                         logger.error(f"   ⚠️ 视频下载失败")
@@ -233,24 +385,14 @@ class DouyinVideoProvider(BaseProvider):
             author_name = video_info.get("author", {}).get("nickname", "未知作者")
 
             # 格式化内容文本
-            content_text = self._format_video_info_text(video_info)
-            markdown_content = self._format_as_markdown_from_downloader_info(video_info)
+            content_text, markdown_content = self._format_both(video_info)
 
             # 8. 保存到本地（如果启用）
             if self.force_save and storage_info:
-                # 保存JSON格式的完整数据
-                json_path = os.path.join(storage_info["article_dir"], "video_info.json")
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(video_info, f, ensure_ascii=False, indent=2)
-
-                # 保存文本内容
-                self.storage.save_text_content(storage_info, content_text)
-
-                # 保存markdown格式
-                self.storage.save_markdown_content(storage_info, markdown_content, title)
-
-                # 保存文章索引
-                self.storage.save_article_index(storage_info, video_info.get("desc", "")[:200])
+                # 所有文件在一次线程池调用中写完，不阻塞其他并发抓取
+                await asyncio.to_thread(
+                    self._save_outputs, storage_info, video_info, content_text, markdown_content, title
+                )
 
             item = ScrapedDataItem(
                 title=title,
@@ -258,7 +400,7 @@ class DouyinVideoProvider(BaseProvider):
                 content=content_text,
                 markdown_content=markdown_content,
                 images=[],
-                save_directory=(storage_info.get("article_dir") if storage_info else None),
+                save_directory=article_dir,
             )
 
             logger.info("\n" + "=" * 80)
@@ -271,136 +413,194 @@ class DouyinVideoProvider(BaseProvider):
             logger.error(f"\n❌ 获取抖音视频信息失败: {str(e)}")
             raise
 
-    def _format_as_markdown_from_downloader_info(self, video_info: Dict[str, Any]) -> str:
+    def _save_outputs(
+        self,
+        storage_info: Dict[str, str],
+        video_info: Dict[str, Any],
+        content_text: str,
+        markdown_content: str,
+        title: str,
+    ) -> None:
+        """同步写入 JSON / 文本 / Markdown 和文章索引，供 asyncio.to_thread 调用"""
+        # 保存JSON格式的完整数据
+        write_json_file(os.path.join(storage_info["article_dir"], "video_info.json"), video_info)
+
+        # 保存文本内容
+        self.storage.save_text_content(storage_info, content_text)
+
+        # 保存markdown格式
+        self.storage.save_markdown_content(storage_info, markdown_content, title)
+
+        # 保存文章索引
+        self.storage.save_article_index(storage_info, video_info.get("desc", "")[:200])
+
+    @classmethod
+    async def fetch_and_parse_batch(
+        cls,
+        urls: List[str],
+        *,
+        max_concurrency: int = 5,
+        release_resources: bool = True,
+        **init_kwargs: Any,
+    ) -> List[Union[ScrapedDataItem, Exception]]:
         """
-        将下载器返回的视频信息格式化为Markdown
+        并发获取多个抖音视频（共享浏览器池与下载器，信号量限制并发）
+
+        Args:
+            urls: 抖音视频URL列表
+            max_concurrency: 最大并发数，需结合抖音的频率限制调整
+            release_resources: 结束后是否关闭当前事件循环上的共享下载器和浏览器；
+                在 Crawler 的常驻循环上调用时传 False，交由 Crawler.close() 释放
+            **init_kwargs: 传给构造函数的其余参数（config、cookies 等）
+
+        Returns:
+            list: 与 urls 一一对应的结果，失败项为对应的异常
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        # Cookie 列表只格式化一次，各 Provider 直接拿到字符串；同一 Cookie 的 Provider 共享下载器和 User-Agent
+        if isinstance(init_kwargs.get("cookies"), list):
+            init_kwargs["cookies"] = format_cookies_to_string(init_kwargs["cookies"])
+        init_kwargs.setdefault("shared_downloader", True)
+
+        async def _one(u: str) -> ScrapedDataItem:
+            async with sem:
+                provider = cls(u, **init_kwargs)
+                try:
+                    return await provider.fetch_and_parse()
+                finally:
+                    await provider.close()
+
+        try:
+            return await asyncio.gather(*(_one(u) for u in urls), return_exceptions=True)
+        finally:
+            if release_resources:
+                # 共享下载器与浏览器绑定在当前循环上，循环随调用方结束（如 asyncio.run）前需要关闭
+                try:
+                    await shutdown_downloaders()
+                finally:
+                    await browser_pool.close()
+
+    def _format_both(self, video_info: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        一次遍历视频信息，同时生成纯文本和Markdown两种格式
 
         Args:
             video_info: 下载器extract_video_info返回的视频信息字典
 
         Returns:
-            str: Markdown格式的内容
+            tuple: (纯文本内容, Markdown内容)
         """
-        md_lines = []
+        # 各子字典只取一次，后面直接用局部变量
+        author = video_info.get("author") or {}
+        stats = video_info.get("statistics") or {}
+        video = video_info.get("video") or {}
+        create_time = video_info.get("create_time")
+        complete_url = video_info.get("complete_url")
+        local_video_path = video_info.get("local_video_path")
 
-        # 标题
-        title = video_info.get("desc", "抖音视频")
-        md_lines.append(f"# {title}\n")
+        # 标题 / 基本信息
+        md_lines = [f"# {video_info.get('desc', '抖音视频')}\n"]
+        lines = [
+            f"标题: {video_info.get('desc', '无标题')}",
+            f"作品ID: {video_info.get('aweme_id', 'N/A')}",
+        ]
 
         # 作者信息
-        author = video_info.get("author", {})
         if author:
-            md_lines.append(f"**作者**: {author.get('nickname', 'N/A')}")
-            if author.get("unique_id"):
-                md_lines.append(f"**抖音号**: {author.get('unique_id')}")
+            nickname = author.get("nickname", "N/A")
+            md_lines.append(f"**作者**: {nickname}")
+            lines.append(f"作者: {nickname}")
+            unique_id = author.get("unique_id")
+            if unique_id:
+                md_lines.append(f"**抖音号**: {unique_id}")
+                lines.append(f"抖音号: {unique_id}")
             md_lines.append("")
 
-        # 统计信息
-        stats = video_info.get("statistics", {})
+        # 统计信息（Markdown 中在视频信息之前，纯文本中在其之后）
+        stat_lines = []
         if stats:
-            md_lines.append("## 数据统计\n")
-            md_lines.append(f"- 点赞数: {stats.get('digg_count', 0):,}")
-            md_lines.append(f"- 评论数: {stats.get('comment_count', 0):,}")
-            md_lines.append(f"- 分享数: {stats.get('share_count', 0):,}")
-            md_lines.append(f"- 收藏数: {stats.get('collect_count', 0):,}\n")
+            digg = f"{stats.get('digg_count', 0):,}"
+            comment = f"{stats.get('comment_count', 0):,}"
+            share = f"{stats.get('share_count', 0):,}"
+            collect = f"{stats.get('collect_count', 0):,}"
+            md_lines.extend(
+                [
+                    "## 数据统计\n",
+                    f"- 点赞数: {digg}",
+                    f"- 评论数: {comment}",
+                    f"- 分享数: {share}",
+                    f"- 收藏数: {collect}\n",
+                ]
+            )
+            stat_lines = [f"点赞: {digg}", f"评论: {comment}", f"分享: {share}", f"收藏: {collect}"]
 
         # 视频信息
-        video = video_info.get("video", {})
         if video:
             md_lines.append("## 视频信息\n")
             duration = video.get("duration", 0)
             if duration:
                 md_lines.append(f"- 时长: {duration:.1f} 秒")
+                lines.append(f"时长: {duration:.1f}秒")
 
             width = video.get("width", 0)
             height = video.get("height", 0)
             if width and height:
                 md_lines.append(f"- 分辨率: {width}x{height}")
+                lines.append(f"分辨率: {width}x{height}")
 
-            if video.get("ratio"):
-                md_lines.append(f"- 比例: {video.get('ratio')}")
+            ratio = video.get("ratio")
+            if ratio:
+                md_lines.append(f"- 比例: {ratio}")
 
             # 显示封面
-            if video.get("cover_url"):
-                md_lines.append(f"\n![封面]({video.get('cover_url')})\n")
+            cover_url = video.get("cover_url")
+            if cover_url:
+                md_lines.append(f"\n![封面]({cover_url})\n")
+
+        lines.extend(stat_lines)
 
         # 发布时间
-        create_time = video_info.get("create_time")
         if create_time:
-            dt = datetime.fromtimestamp(create_time)
-            md_lines.append(f"**发布时间**: {dt.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            published = _fmt_ts(int(create_time))
+            md_lines.append(f"**发布时间**: {published}\n")
+            lines.append(f"发布时间: {published}")
 
         # 链接信息
-        if video_info.get("complete_url"):
-            md_lines.append(f"## 链接\n")
-            md_lines.append(f"[查看原视频]({video_info.get('complete_url')})\n")
+        if complete_url:
+            md_lines.extend([f"## 链接\n", f"[查看原视频]({complete_url})\n"])
 
         # 本地保存路径
-        if video_info.get("local_video_path"):
-            md_lines.append(f"**本地视频**: `{video_info.get('local_video_path')}`\n")
+        if local_video_path:
+            md_lines.append(f"**本地视频**: `{local_video_path}`\n")
 
         # 清晰度选项
-        quality_urls = video.get("quality_urls", {})
+        quality_urls = video.get("quality_urls")
         if quality_urls:
             md_lines.append("## 可用清晰度\n")
-            for quality, url in quality_urls.items():
-                md_lines.append(f"- {quality}")
+            md_lines.extend(f"- {quality}" for quality in quality_urls)
             md_lines.append("")
 
-        return "\n".join(md_lines)
+        return "\n".join(lines), "\n".join(md_lines)
 
-    def _format_video_info_text(self, video_info: Dict[str, Any]) -> str:
-        """
-        将视频信息格式化为纯文本
+    def _format_as_markdown_from_downloader_info(self, video_info: Dict[str, Any]) -> str:
+        """将下载器返回的视频信息格式化为Markdown"""
+        return self._format_both(video_info)[1]
 
-        Args:
-            video_info: 视频信息字典
+    def _format_video_info_text(self, video_info: Dict[str, Any]) -> str:
+        """将视频信息格式化为纯文本"""
+        return self._format_both(video_info)[0]
 
-        Returns:
-            str: 纯文本格式的内容
+    async def close(self):
         """
-        lines = []
-
-        # 基本信息
-        lines.append(f"标题: {video_info.get('desc', '无标题')}")
-        lines.append(f"作品ID: {video_info.get('aweme_id', 'N/A')}")
-
-        # 作者信息
-        author = video_info.get("author", {})
-        if author:
-            lines.append(f"作者: {author.get('nickname', 'N/A')}")
-            if author.get("unique_id"):
-                lines.append(f"抖音号: {author.get('unique_id')}")
-
-        # 视频信息
-        video = video_info.get("video", {})
-        if video:
-            duration = video.get("duration", 0)
-            if duration:
-                lines.append(f"时长: {duration:.1f}秒")
-
-            width = video.get("width", 0)
-            height = video.get("height", 0)
-            if width and height:
-                lines.append(f"分辨率: {width}x{height}")
+        关闭连接
 
-        # 统计数据
-        stats = video_info.get("statistics", {})
-        if stats:
-            lines.append(f"点赞: {stats.get('digg_count', 0):,}")
-            lines.append(f"评论: {stats.get('comment_count', 0):,}")
-            lines.append(f"分享: {stats.get('share_count', 0):,}")
-            lines.append(f"收藏: {stats.get('collect_count', 0):,}")
-
-        # 发布时间
-        create_time = video_info.get("create_time")
-        if create_time:
-            dt = datetime.fromtimestamp(create_time)
-            lines.append(f"发布时间: {dt.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        return "\n".join(lines)
-
-    async def close(self):
-        """关闭连接"""
-        if hasattr(self.downloader, "client"):
-            await self.downloader.client.aclose()
+        托管模式下只注销共享下载器的使用者，下载器和浏览器由 Crawler / 批量抓取统一关闭；
+        独立使用时关闭自己的下载器，以及获取用户ID时在当前循环上启动的共享浏览器
+        """
+        if self._shared_downloader:
+            await _release_downloader(self.downloader)
+            return
+        try:
+            await self.downloader.close()
+        finally:
+            await browser_pool.close()
@@ -1,19 +1,21 @@
 import os
 import re
-import json
 import time
 import asyncio
 import httpx
-from typing import Any, List
+from typing import Any, List, Optional
 from loguru import logger
-from concurrent.futures import ThreadPoolExecutor
-from urllib.parse import urlparse, parse_qs, unquote
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from urllib.parse import urlsplit, parse_qs, unquote
 from bs4 import BeautifulSoup
 
 from ..providers.base import BaseProvider
 from ..models import ScrapedDataItem, ImageInfo
-from ..utils.file_utils import get_file_extension, get_random_user_agent
+from ..utils.browser_utils import HEADLESS_SCRAPE_ARGS, make_route_blocker
+from ..utils.file_utils import filter_cookies_for_url, get_file_extension, get_random_user_agent, write_json_file
+
+# 微博搜索结果页的主机名与路径前缀
+_SEARCH_HOST = "s.weibo.com"
+_SEARCH_PATH_PREFIX = "/weibo"
 
 
 class WeiboProvider(BaseProvider):
@@ -32,19 +34,21 @@ class WeiboProvider(BaseProvider):
         config: Any,
         cookies: list | None = None,
         force_save: bool = True,
+        http_client: Optional[httpx.Client] = None,
     ):
-        super().__init__(url, config, force_save, "weibo")
+        super().__init__(url, config, force_save, "weibo", http_client)
         self.cookies = cookies
 
     def _is_weibo_search_page(self) -> bool:
         """判断是否为微博搜索页面"""
-        return "s.weibo.com/weibo" in self.url
+        parsed = urlsplit(self.url)
+        return parsed.hostname == _SEARCH_HOST and parsed.path.startswith(_SEARCH_PATH_PREFIX)
 
     def _extract_search_query(self) -> tuple[str, str]:
         """从URL中提取搜索关键词"""
         search_query = "default"
         try:
-            parsed_url = urlparse(self.url)
+            parsed_url = urlsplit(self.url)
             query_params = parse_qs(parsed_url.query)
             if "q" in query_params:
                 search_query = unquote(query_params["q"][0])
@@ -75,7 +79,7 @@ class WeiboProvider(BaseProvider):
 
         def _sync_playwright_parse():
             """同步Playwright解析函数"""
-            from playwright.sync_api import sync_playwright
+            from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
             logger.info("=" * 50)
             logger.info("🚀 开始执行微博第一条帖子抓取任务...")
@@ -92,7 +96,7 @@ class WeiboProvider(BaseProvider):
                     headless=True,
                     slow_mo=50,
                     ignore_default_args=["--enable-automation"],
-                    args=["--disable-blink-features=AutomationControlled"],
+                    args=list(HEADLESS_SCRAPE_ARGS),
                 )
 
                 # 2. 创建一个新的、独立的上下文
@@ -107,13 +111,16 @@ class WeiboProvider(BaseProvider):
                 # 加载已保存的登录cookies
                 saved_cookies = self.cookies
                 if saved_cookies:
-                    context.add_cookies(saved_cookies)
+                    context.add_cookies(filter_cookies_for_url(saved_cookies, self.url))
                     logger.info("✅ 登录状态已加载")
+
+                # 视频链接依赖播放器初始化，只拦截图片和字体
+                context.route("**/*", make_route_blocker(frozenset({"image", "font"})))
                 page = context.new_page()
 
                 try:
                     logger.debug("🌐 导航至目标页面...")
-                    page.goto(self.url, timeout=90000, wait_until="load")
+                    page.goto(self.url, timeout=90000, wait_until="domcontentloaded")
                     logger.info("✅ 页面初步加载完成。")
 
                     logger.debug("⏳ 正在等待搜索结果加载...")
@@ -227,8 +234,7 @@ class WeiboProvider(BaseProvider):
                         }
 
                         json_path = os.path.join(storage_info["article_dir"], "post_data.json")
-                        with open(json_path, "w", encoding="utf-8") as f:
-                            json.dump(json_data, f, ensure_ascii=False, indent=4)
+                        write_json_file(json_path, json_data)
 
                         self.storage.save_article_index(storage_info, post_content[:200])
 
@@ -271,10 +277,8 @@ class WeiboProvider(BaseProvider):
                     logger.info("🔒 关闭浏览器...")
                     context.close()
 
-        # 在线程池中执行同步代码
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, _sync_playwright_parse)
+        # 在事件循环的默认线程池中执行同步代码（由 Crawler 注入为共享线程池），并继承当前上下文
+        return await asyncio.to_thread(_sync_playwright_parse)
 
     def _sync_download_images(self, first_post, page, storage_info: dict) -> List[str]:
         """同步下载图片"""
@@ -298,7 +302,7 @@ class WeiboProvider(BaseProvider):
                         # 获取高质量图片URL
                         large_img_url = img_url.replace("/orj360/", "/large/").replace("/thumbnail/", "/large/")
 
-                        response = httpx.get(large_img_url, timeout=20)
+                        response = self.http.get(large_img_url, timeout=20)
                         response.raise_for_status()
 
                         # 获取正确的文件扩展名
@@ -346,7 +350,7 @@ class WeiboProvider(BaseProvider):
 
                         video_file_path = os.path.join(storage_info["attachments_dir"], "video.mp4")
 
-                        with httpx.stream("GET", video_url, timeout=300) as response:
+                        with self.http.stream("GET", video_url, timeout=300) as response:
                             response.raise_for_status()
                             with open(video_file_path, "wb") as f:
                                 for chunk in response.iter_bytes(chunk_size=1024 * 1024):
@@ -1,16 +1,15 @@
 import os
 import asyncio
 import httpx
-import concurrent.futures
 from loguru import logger
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional
 from bs4 import BeautifulSoup, Tag
 from bs4.element import NavigableString
-from playwright.sync_api import sync_playwright
 
 from ..providers.base import BaseProvider
 from ..models import ScrapedDataItem, ImageInfo
-from ..utils.file_utils import get_file_extension, get_random_user_agent
+from ..utils.browser_utils import HEADLESS_SCRAPE_ARGS, make_route_blocker
+from ..utils.file_utils import filter_cookies_for_url, get_file_extension, get_random_user_agent
 
 
 class WeixinMpProvider(BaseProvider):
@@ -21,8 +20,10 @@ class WeixinMpProvider(BaseProvider):
     """
 
     MAX_IMAGE_SIZE = 10485760  # 10MB
+    IMAGE_CHUNK_SIZE = 65536  # 64KB
     HTTP_TIMEOUT = 30  # s
     PLAYWRIGHT_TIMEOUT = 60000  # ms
+    IMAGE_DOWNLOAD_CONCURRENCY = 16
 
     def __init__(
         self,
@@ -30,8 +31,10 @@ class WeixinMpProvider(BaseProvider):
         config: Any,
         cookies: list | None = None,
         force_save: bool = True,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ):
-        super().__init__(url, config, force_save, "weixin")
+        super().__init__(url, config, force_save, "weixin", http_client, async_http_client)
         self.storage_info = None
         self.img_counter = 0
         self.cookies = cookies
@@ -50,15 +53,24 @@ class WeixinMpProvider(BaseProvider):
             return None
 
         try:
-            response = httpx.get(img_url, timeout=self.HTTP_TIMEOUT)
-            response.raise_for_status()
+            # 流式读取并边读边检查大小，没有 Content-Length 的超大图片也能中途放弃
+            with self.http.stream("GET", img_url, timeout=self.HTTP_TIMEOUT) as response:
+                response.raise_for_status()
 
-            content_length = response.headers.get("Content-Length")
-            if content_length and int(content_length) > self.MAX_IMAGE_SIZE:
-                logger.warning(f"  - 图片过大，跳过: {img_url}")
-                return None
+                content_length = response.headers.get("Content-Length")
+                if content_length and int(content_length) > self.MAX_IMAGE_SIZE:
+                    logger.warning(f"  - 图片过大，跳过: {img_url}")
+                    return None
 
-            return response.content
+                chunks, size = [], 0
+                for chunk in response.iter_bytes(self.IMAGE_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.MAX_IMAGE_SIZE:
+                        logger.warning(f"  - 图片过大，跳过: {img_url}")
+                        return None
+                    chunks.append(chunk)
+
+            return b"".join(chunks)
 
         except Exception as e:
             logger.error(f"  - 下载图片失败: {img_url}, 错误: {e}")
@@ -122,52 +134,79 @@ class WeixinMpProvider(BaseProvider):
             return None
 
     def convert_tag_to_markdown(self, tag, save_dir: str) -> str:
-        """递归地将 BeautifulSoup 的 tag 转换成 Markdown 字符串"""
-        markdown_str = ""
+        """将 BeautifulSoup 的 tag 转换成 Markdown 字符串（图片即时下载到 save_dir）"""
+
+        def _img_to_markdown(img) -> str:
+            img_src = img.get("data-src") or img.get("src")
+            alt_text = img.get("alt", "image")
+            if save_dir:
+                img_local_path = self.download_image(img_src, save_dir)
+                return f"![{alt_text}]({img_local_path})\n" if img_local_path else ""
+            return f"![{alt_text}]({img_src})\n"
+
+        return self._tags_to_markdown([tag], _img_to_markdown)
+
+    def _tags_to_markdown(self, tags, img_to_markdown: Callable[[Tag], str]) -> str:
+        """
+        用显式栈迭代地把一组顶层 tag 转换成 Markdown（避免深层嵌套 section 的递归开销和字符串反复拼接）
+
+        栈中的字符串原样输出，Tag 按类型展开；p/section 的子节点逆序入栈，末尾压入段落分隔符。
+        p/section 的直接子 img 以 ("img", tag) 入栈、出栈时才转换，保证图片回调（及其编号）按文档顺序触发。
+        """
+        parts: List[str] = []
+        stack: List[Any] = list(reversed(tags))
+
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+                continue
+            if isinstance(node, tuple):
+                parts.append(img_to_markdown(node[1]))
+                continue
+
+            if node.name in ["p", "section"]:
+                items: List[Any] = []
+                for child in node.children:
+                    if isinstance(child, NavigableString):
+                        items.append(str(child))
+                    elif child.name == "img":
+                        items.append(("img", child))
+                    elif child.name == "br":
+                        items.append("\n")
+                    else:
+                        items.append(child)
+                items.append("\n\n")
+                stack.extend(reversed(items))
+            else:
+                parts.append(self._leaf_tag_to_markdown(node))
+
+        return "".join(parts)
 
+    @staticmethod
+    def _leaf_tag_to_markdown(tag) -> str:
+        """转换不需要展开子节点的 tag（标题、引用、代码、链接、加粗及其他）"""
         if tag.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
             level = int(tag.name[1])
-            markdown_str = f"{'#' * level} {tag.get_text(strip=True)}\n\n"
-
-        elif tag.name in ["p", "section"]:
-            for child in tag.children:
-                if isinstance(child, NavigableString):
-                    markdown_str += str(child)
-                elif child.name == "img":
-                    img_src = child.get("data-src") or child.get("src")
-                    alt_text = child.get("alt", "image")
-                    if save_dir:
-                        img_local_path = self.download_image(img_src, save_dir)
-                        if img_local_path:
-                            markdown_str += f"![{alt_text}]({img_local_path})\n"
-                    else:
-                        markdown_str += f"![{alt_text}]({img_src})\n"
-                elif child.name == "br":
-                    markdown_str += "\n"
-                else:
-                    markdown_str += self.convert_tag_to_markdown(child, save_dir)
-            markdown_str += "\n\n"
-
-        elif tag.name == "blockquote":
+            return f"{'#' * level} {tag.get_text(strip=True)}\n\n"
+
+        if tag.name == "blockquote":
             content = tag.get_text(separator="\n", strip=True)
-            markdown_str = "".join([f"> {line}\n" for line in content.split("\n")]) + "\n"
+            return "".join([f"> {line}\n" for line in content.split("\n")]) + "\n"
 
-        elif tag.name == "pre" or (tag.name == "section" and "code-snippet__js" in tag.get("class", [])):
+        if tag.name == "pre" or (tag.name == "section" and "code-snippet__js" in tag.get("class", [])):
             code_content = tag.get_text()
-            markdown_str = f"```\n{code_content.strip()}\n```\n\n"
+            return f"```\n{code_content.strip()}\n```\n\n"
 
-        elif tag.name == "a":
+        if tag.name == "a":
             link_text = tag.get_text(strip=True)
             href = tag.get("href", "")
-            markdown_str = f"[{link_text}]({href})"
-
-        elif tag.name == "strong":
-            markdown_str = f"**{tag.get_text(strip=True)}**"
+            return f"[{link_text}]({href})"
 
-        else:
-            markdown_str = tag.get_text()
+        if tag.name == "strong":
+            return f"**{tag.get_text(strip=True)}**"
 
-        return markdown_str
+        return tag.get_text()
 
     async def fetch_and_parse(self) -> Any:
         """使用 Playwright 获取和解析微信公众号文章，失败时降级到基础抓取"""
@@ -178,8 +217,10 @@ class WeixinMpProvider(BaseProvider):
             # TODO 实现降级方案
             raise NotImplementedError("Playwright 抓取失败，且降级方案未实现")
 
-    def _sync_playwright_parse(self) -> dict:
-        """同步版本的 Playwright 抓取实现"""
+    def _sync_playwright_parse(self) -> str:
+        """同步版本的 Playwright 抓取实现，只负责渲染页面并返回 HTML"""
+        from playwright.sync_api import sync_playwright
+
         with sync_playwright() as playwright:
             # 使用持久化上下文，减少反爬虫检测
             try:
@@ -188,7 +229,7 @@ class WeixinMpProvider(BaseProvider):
                 browser = playwright.chromium.launch(
                     headless=True,
                     ignore_default_args=["--enable-automation"],
-                    args=["--disable-blink-features=AutomationControlled"],
+                    args=list(HEADLESS_SCRAPE_ARGS),
                 )
 
                 # 2. 从浏览器实例创建 "上下文" (Context)
@@ -202,103 +243,27 @@ class WeixinMpProvider(BaseProvider):
                 # 3. (可选) 如果你需要加载 cookies，在这里添加
                 cookies = self.cookies  # 假设你有这个函数
                 if cookies:
-                    context.add_cookies(cookies)
+                    context.add_cookies(filter_cookies_for_url(cookies, self.url))
 
             except Exception as e:
                 raise Exception(f"Playwright 浏览器启动失败: {e}")
 
+            # 拦截图片/字体/媒体及统计脚本，正文解析不依赖这些资源
+            context.route("**/*", make_route_blocker())
+
             page = context.new_page()
 
             try:
                 logger.debug(f"🌐 正在访问页面: {self.url}")
-                page.goto(self.url, timeout=60000)
+                page.goto(self.url, timeout=60000, wait_until="domcontentloaded")
 
-                # 等待关键内容加载
-                page.wait_for_selector("#js_content", timeout=60000)
+                # 等待正文或验证/拦截页出现，二者择一即可，避免在拦截页上空等超时
+                page.wait_for_selector("#js_content, .weui-msg", timeout=60000)
+                if page.locator("#js_content").count() == 0:
+                    raise ValueError(f"页面被拦截或需要验证: {page.url}")
                 logger.debug("✅ 页面内容已加载！")
 
-                html_content = page.content()
-                soup = BeautifulSoup(html_content, "lxml")
-
-                # 提取标题
-                title_element = soup.find(id="activity-name")
-                if not title_element:
-                    raise ValueError("无法在页面中找到标题元素")
-                title = title_element.get_text(strip=True)
-
-                # 提取作者
-                author_element = soup.find(id="js_name")
-                author = author_element.get_text(strip=True) if author_element else "未知作者"
-
-                # 提取正文内容
-                content_element = soup.find(id="js_content")
-                if not content_element:
-                    raise ValueError("无法在页面中找到正文容器")
-
-                # 纯文本内容
-                content = content_element.get_text(strip=True)
-
-                # 创建存储结构（如果启用强制保存或需要保存图片/Markdown）
-                storage_info = None
-                if self.force_save:
-                    storage_info = self.storage.create_article_storage(
-                        platform=self.platform_name,
-                        title=title,
-                        url=self.url,
-                        author=author,
-                    )
-
-                # 保存纯文本内容
-                if storage_info:
-                    self.storage.save_text_content(storage_info, content)
-
-                # 处理 Markdown 格式
-                markdown_content = None
-                if isinstance(content_element, Tag):
-                    markdown_parts = []
-
-                    for tag in content_element.find_all(recursive=False):
-                        md_part = self._sync_convert_tag_to_markdown(tag, storage_info)
-                        markdown_parts.append(md_part)
-
-                    markdown_content = "".join(markdown_parts)
-
-                    # 保存 Markdown 文件
-                    if storage_info:
-                        self.storage.save_markdown_content(storage_info, markdown_content, title, author)
-
-                # 收集图片信息
-                images = []
-                if isinstance(content_element, Tag):
-                    for img in content_element.find_all("img"):
-                        if isinstance(img, Tag):
-                            img_src_raw = img.get("data-src") or img.get("src")
-                            alt_text_raw = img.get("alt", "")
-
-                            # 确保类型安全
-                            img_src = str(img_src_raw) if img_src_raw else ""
-                            alt_text = str(alt_text_raw) if alt_text_raw else ""
-
-                            if img_src:
-                                local_path = None
-                                if storage_info:
-                                    local_path = self.download_image_with_storage(img_src, storage_info, alt_text)
-
-                                images.append({"original_url": img_src, "local_path": local_path, "alt_text": alt_text})
-
-                # 保存文章索引
-                if storage_info:
-                    self.storage.save_article_index(storage_info, content[:200])
-
-                return {
-                    "title": title,
-                    "author": author,
-                    "content": content,
-                    "markdown_content": markdown_content,
-                    "images": images,
-                    "save_directory": (storage_info["article_dir"] if storage_info else None),
-                    "storage_info": storage_info,
-                }
+                return page.content()
 
             except Exception as e:
                 raise Exception(f"Playwright 页面处理失败: {e}")
@@ -306,78 +271,197 @@ class WeixinMpProvider(BaseProvider):
             finally:
                 context.close()
 
-    def _sync_convert_tag_to_markdown(self, tag, storage_info=None) -> str:
-        """同步版本的 Markdown 转换"""
-        markdown_str = ""
+    def _parse_article(self, html_content: str) -> dict:
+        """解析文章 HTML：提取标题/作者/正文，创建存储目录并保存纯文本，收集待下载的图片"""
+        soup = BeautifulSoup(html_content, "lxml")
+
+        # 提取标题
+        title_element = soup.find(id="activity-name")
+        if not title_element:
+            raise ValueError("无法在页面中找到标题元素")
+        title = title_element.get_text(strip=True)
+
+        # 提取作者
+        author_element = soup.find(id="js_name")
+        author = author_element.get_text(strip=True) if author_element else "未知作者"
+
+        # 提取正文内容
+        content_element = soup.find(id="js_content")
+        if not content_element:
+            raise ValueError("无法在页面中找到正文容器")
+
+        # 纯文本内容
+        content = content_element.get_text(strip=True)
+
+        # 创建存储结构（如果启用强制保存或需要保存图片/Markdown）
+        storage_info = None
+        if self.force_save:
+            storage_info = self.storage.create_article_storage(
+                platform=self.platform_name,
+                title=title,
+                url=self.url,
+                author=author,
+            )
+
+        # 保存纯文本内容
+        if storage_info:
+            self.storage.save_text_content(storage_info, content)
+
+        # 收集图片信息（同一张图片只下载一次）
+        images = []
+        image_sources: Dict[str, str] = {}
+        if isinstance(content_element, Tag):
+            for img in content_element.find_all("img"):
+                if isinstance(img, Tag):
+                    img_src_raw = img.get("data-src") or img.get("src")
+                    alt_text_raw = img.get("alt", "")
+
+                    # 确保类型安全
+                    img_src = str(img_src_raw) if img_src_raw else ""
+                    alt_text = str(alt_text_raw) if alt_text_raw else ""
+
+                    if img_src:
+                        images.append((img_src, alt_text))
+                        image_sources.setdefault(img_src, alt_text)
+
+        return {
+            "title": title,
+            "author": author,
+            "content": content,
+            "content_element": content_element,
+            "storage_info": storage_info,
+            "images": images,
+            "image_sources": image_sources,
+        }
+
+    async def _adownload_image_content(self, client: httpx.AsyncClient, img_url: str) -> Optional[bytes]:
+        """_download_image_content 的异步版本，使用传入的共享客户端"""
+        if not img_url or not img_url.startswith("http"):
+            return None
 
-        if tag.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            level = int(tag.name[1])
-            markdown_str = f"{'#' * level} {tag.get_text(strip=True)}\n\n"
-
-        elif tag.name in ["p", "section"]:
-            for child in tag.children:
-                if isinstance(child, NavigableString):
-                    markdown_str += str(child)
-                elif child.name == "img":
-                    img_src = child.get("data-src") or child.get("src")
-                    alt_text = child.get("alt", "image")
-                    if storage_info:
-                        img_local_path = self.download_image_with_storage(str(img_src), storage_info, str(alt_text))
-                        if img_local_path:
-                            # 使用相对路径在Markdown中引用图片
-                            relative_path = f"images/{os.path.basename(img_local_path)}"
-                            markdown_str += f"![{alt_text}]({relative_path})\n"
-                        else:
-                            markdown_str += f"![{alt_text}]({img_src})\n"
-                    else:
-                        markdown_str += f"![{alt_text}]({img_src})\n"
-                elif child.name == "br":
-                    markdown_str += "\n"
-                else:
-                    markdown_str += self._sync_convert_tag_to_markdown(child, storage_info)
-            markdown_str += "\n\n"
-
-        elif tag.name == "blockquote":
-            content = tag.get_text(separator="\n", strip=True)
-            markdown_str = "".join([f"> {line}\n" for line in content.split("\n")]) + "\n"
+        try:
+            async with client.stream("GET", img_url, timeout=self.HTTP_TIMEOUT) as response:
+                response.raise_for_status()
 
-        elif tag.name == "pre" or (tag.name == "section" and "code-snippet__js" in tag.get("class", [])):
-            code_content = tag.get_text()
-            markdown_str = f"```\n{code_content.strip()}\n```\n\n"
+                content_length = response.headers.get("Content-Length")
+                if content_length and int(content_length) > self.MAX_IMAGE_SIZE:
+                    logger.warning(f"  - 图片过大，跳过: {img_url}")
+                    return None
 
-        elif tag.name == "a":
-            link_text = tag.get_text(strip=True)
-            href = tag.get("href", "")
-            markdown_str = f"[{link_text}]({href})"
+                chunks, size = [], 0
+                async for chunk in response.aiter_bytes(self.IMAGE_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.MAX_IMAGE_SIZE:
+                        logger.warning(f"  - 图片过大，跳过: {img_url}")
+                        return None
+                    chunks.append(chunk)
 
-        elif tag.name == "strong":
-            markdown_str = f"**{tag.get_text(strip=True)}**"
+            return b"".join(chunks)
 
-        else:
-            markdown_str = tag.get_text()
+        except Exception as e:
+            logger.error(f"  - 下载图片失败: {img_url}, 错误: {e}")
+            return None
 
-        return markdown_str
+    async def _download_images(self, image_sources: Dict[str, str], storage_info: dict) -> Dict[str, str]:
+        """并发下载正文图片（复用同一连接池）并通过存储管理器保存，返回 原始URL -> 本地路径"""
+        sem = asyncio.Semaphore(self.IMAGE_DOWNLOAD_CONCURRENCY)
 
-    async def _playwright_parse(self) -> Any:
-        """异步包装器，在执行器中运行同步 Playwright"""
-        loop = asyncio.get_event_loop()
+        async with self.async_http() as client:
 
-        # 使用 ThreadPoolExecutor 来运行同步代码
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            try:
-                result_dict = await loop.run_in_executor(executor, self._sync_playwright_parse)
-
-                # 转换回 ScrapedDataItem 对象
-                images = [ImageInfo(**img_data) for img_data in result_dict["images"]]
-
-                return ScrapedDataItem(
-                    title=result_dict["title"],
-                    author=result_dict["author"],
-                    content=result_dict["content"],
-                    markdown_content=result_dict["markdown_content"],
-                    images=images,
-                    save_directory=result_dict["save_directory"],
-                )
+            async def _one(img_url: str) -> Optional[bytes]:
+                async with sem:
+                    return await self._adownload_image_content(client, img_url)
+
+            contents = await asyncio.gather(*(_one(img_url) for img_url in image_sources))
 
+        return await asyncio.to_thread(self._save_images, storage_info, image_sources, contents)
+
+    def _save_images(
+        self, storage_info: dict, image_sources: Dict[str, str], contents: List[Optional[bytes]]
+    ) -> Dict[str, str]:
+        """按文中顺序保存已下载的图片，供 asyncio.to_thread 调用"""
+        image_paths = {}
+        for (img_url, alt_text), content in zip(image_sources.items(), contents):
+            if content is None:
+                continue
+            try:
+                image_info = self.storage.save_image(storage_info, content, img_url, alt_text, self.img_counter + 1)
+                self.img_counter += 1
+                image_paths[img_url] = image_info["local_path"]
             except Exception as e:
-                raise e
+                logger.error(f"  - 通过存储管理器保存图片失败: {img_url}, 错误: {e}")
+        return image_paths
+
+    def _finish_article(self, article: dict, image_paths: Dict[str, str]) -> dict:
+        """生成并保存 Markdown、保存文章索引，返回结果字典"""
+        storage_info = article["storage_info"]
+        content_element = article["content_element"]
+
+        # 处理 Markdown 格式
+        markdown_content = None
+        if isinstance(content_element, Tag):
+            markdown_content = "".join(
+                self._sync_convert_tag_to_markdown(tag, image_paths)
+                for tag in content_element.find_all(recursive=False)
+            )
+
+            # 保存 Markdown 文件
+            if storage_info:
+                self.storage.save_markdown_content(storage_info, markdown_content, article["title"], article["author"])
+
+        images = [
+            {"original_url": img_src, "local_path": image_paths.get(img_src), "alt_text": alt_text}
+            for img_src, alt_text in article["images"]
+        ]
+
+        # 保存文章索引
+        if storage_info:
+            self.storage.save_article_index(storage_info, article["content"][:200])
+
+        return {
+            "title": article["title"],
+            "author": article["author"],
+            "content": article["content"],
+            "markdown_content": markdown_content,
+            "images": images,
+            "save_directory": (storage_info["article_dir"] if storage_info else None),
+            "storage_info": storage_info,
+        }
+
+    def _sync_convert_tag_to_markdown(self, tag, image_paths: Optional[Dict[str, str]] = None) -> str:
+        """同步版本的 Markdown 转换，图片使用已下载好的本地路径（image_paths: 原始URL -> 本地路径）"""
+
+        def _img_to_markdown(img) -> str:
+            img_src = img.get("data-src") or img.get("src")
+            alt_text = img.get("alt", "image")
+            img_local_path = image_paths.get(str(img_src)) if image_paths else None
+            if img_local_path:
+                # 使用相对路径在Markdown中引用图片
+                return f"![{alt_text}](images/{os.path.basename(img_local_path)})\n"
+            return f"![{alt_text}]({img_src})\n"
+
+        return self._tags_to_markdown([tag], _img_to_markdown)
+
+    async def _playwright_parse(self) -> Any:
+        """异步流程：线程中渲染和解析页面，事件循环上并发下载图片，再回到线程生成 Markdown"""
+        # 在事件循环的默认线程池中运行同步代码（由 Crawler 注入为共享线程池），并继承当前上下文
+        html_content = await asyncio.to_thread(self._sync_playwright_parse)
+        article = await asyncio.to_thread(self._parse_article, html_content)
+
+        image_paths: Dict[str, str] = {}
+        if article["storage_info"] and article["image_sources"]:
+            image_paths = await self._download_images(article["image_sources"], article["storage_info"])
+
+        result_dict = await asyncio.to_thread(self._finish_article, article, image_paths)
+
+        # 转换回 ScrapedDataItem 对象
+        images = [ImageInfo(**img_data) for img_data in result_dict["images"]]
+
+        return ScrapedDataItem(
+            title=result_dict["title"],
+            author=result_dict["author"],
+            content=result_dict["content"],
+            markdown_content=result_dict["markdown_content"],
+            images=images,
+            save_directory=result_dict["save_directory"],
+        )
@@ -4,7 +4,6 @@
 """
 
 import asyncio
-import json
 import os
 import time
 import random
@@ -16,7 +15,7 @@ from loguru import logger
 from .base import BaseProvider
 from ..models import ScrapedDataItem
 from ..utils.xhs.apis.xhs_pc_apis import XHS_Apis
-from ..utils.file_utils import get_file_extension, format_cookies_to_string, get_random_user_agent
+from ..utils.file_utils import get_file_extension, format_cookies_to_string, get_random_user_agent, write_json_file
 from ..utils.xhs.xhs_utils.data_util import handle_note_info, norm_str
 
 
@@ -38,6 +37,7 @@ class XiaohongshuProvider(BaseProvider):
         max_retries: int = 3,
         base_delay: float = 5.0,
         save_dir: str = "downloads/xiaohongshu",
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         初始化小红书Provider
@@ -52,6 +52,7 @@ class XiaohongshuProvider(BaseProvider):
             max_retries: 最大重试次数，默认3
             base_delay: 重试基础延时，默认5.0秒
             save_dir: 数据保存目录，默认"downloads/xiaohongshu"
+            async_http_client: 可选的共享 httpx.AsyncClient，用于下载图片
         """
         # 使用虚拟参数初始化BaseProvider，小红书不使用这些参数
         super().__init__(
@@ -59,6 +60,7 @@ class XiaohongshuProvider(BaseProvider):
             config=None,
             force_save=True,
             platform_name=platform_name,
+            async_http_client=async_http_client,
         )
 
         # 自动加载cookies和user_agent
@@ -151,8 +153,7 @@ class XiaohongshuProvider(BaseProvider):
 
         # 保存原始JSON数据
         raw_data_path = os.path.join(storage_info["article_dir"], "raw_data.json")
-        with open(raw_data_path, "w", encoding="utf-8") as f:
-            json.dump(note_data, f, ensure_ascii=False, indent=2)
+        write_json_file(raw_data_path, note_data)
 
         logger.info(f"笔记保存完成: {storage_info['article_dir']}")
 
@@ -741,8 +742,7 @@ class XiaohongshuProvider(BaseProvider):
         filepath = os.path.join(save_path, filename)
 
         # 保存JSON文件
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(note, f, ensure_ascii=False, indent=2)
+        write_json_file(filepath, note)
 
         logger.info(f"笔记已保存到: {filepath}")
         return filepath
@@ -809,8 +809,7 @@ class XiaohongshuProvider(BaseProvider):
         filename = f"user_{user_id}_summary_{timestamp}.json"
         filepath = os.path.join(user_dir, filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        write_json_file(filepath, summary)
 
         logger.info(f"用户笔记汇总已保存到: {filepath}")
         return filepath
@@ -975,31 +974,19 @@ class XiaohongshuProvider(BaseProvider):
                     article_dir_name = f"{article_id}_{safe_title}"
                     article_dir = os.path.join(keyword_dir, article_dir_name)
 
-                    # 创建目录结构
-                    os.makedirs(article_dir, exist_ok=True)
-                    images_dir = os.path.join(article_dir, "images")
-                    os.makedirs(images_dir, exist_ok=True)
-
                     # 构建内容（使用 raw_note 以获取正确的统计数据）
                     content_text = self._build_note_content_text(raw_note, detail)
                     markdown_content = self._build_note_content_markdown(raw_note, detail)
 
-                    # 保存文本内容
-                    text_file = os.path.join(article_dir, f"{safe_title}.txt")
-                    with open(text_file, "w", encoding="utf-8") as f:
-                        f.write(content_text)
-
-                    # 保存 Markdown 内容
+                    # 文本 / Markdown / 原始 JSON 一次性交给线程写入，避免阻塞事件循环
+                    note_files: Dict[str, Any] = {os.path.join(article_dir, f"{safe_title}.txt"): content_text}
                     if save_format in ["markdown", "both"]:
-                        markdown_file = os.path.join(article_dir, f"{safe_title}.md")
-                        with open(markdown_file, "w", encoding="utf-8") as f:
-                            f.write(markdown_content)
-
-                    # 保存原始 JSON 数据
+                        note_files[os.path.join(article_dir, f"{safe_title}.md")] = markdown_content
                     if save_format in ["json", "both"]:
-                        raw_data_path = os.path.join(article_dir, "raw_data.json")
-                        with open(raw_data_path, "w", encoding="utf-8") as f:
-                            json.dump(raw_note, f, ensure_ascii=False, indent=2)
+                        note_files[os.path.join(article_dir, "raw_data.json")] = raw_note
+
+                    images_dir = os.path.join(article_dir, "images")
+                    await asyncio.to_thread(self._write_note_files, images_dir, note_files)
 
                     # 下载图片
                     storage_info = {"article_dir": article_dir}
@@ -1037,8 +1024,7 @@ class XiaohongshuProvider(BaseProvider):
 
                     # 保存元数据
                     metadata_file = os.path.join(article_dir, "metadata.json")
-                    with open(metadata_file, "w", encoding="utf-8") as f:
-                        json.dump(metadata, f, ensure_ascii=False, indent=2)
+                    await asyncio.to_thread(self._write_note_files, article_dir, {metadata_file: metadata})
 
                     saved_directories.append(article_dir)
                     successful_saves += 1
@@ -1255,7 +1241,7 @@ class XiaohongshuProvider(BaseProvider):
             total_images = len(image_list)
 
             timeout = httpx.Timeout(timeout=30)
-            async with httpx.AsyncClient(timeout=timeout) as session:
+            async with self.async_http() as session:
                 for idx, image_url in enumerate(image_list, 1):
                     try:
                         if not image_url:
@@ -1265,7 +1251,7 @@ class XiaohongshuProvider(BaseProvider):
                         # ...
                         # 下载图片
                         # 下载图片
-                        response = await session.get(image_url)  # 1. 直接 await get()
+                        response = await session.get(image_url, timeout=timeout)  # 1. 直接 await get()
 
                         # 2. 检查 status_code (不再使用 async with)
                         if response.status_code == 200:
@@ -1281,8 +1267,8 @@ class XiaohongshuProvider(BaseProvider):
                             filename = f"image_{idx:03d}.{ext}"
                             filepath = os.path.join(images_dir, filename)
 
-                            with open(filepath, "wb") as f:
-                                f.write(content)
+                            # 写盘交给线程池，避免阻塞事件循环
+                            await asyncio.to_thread(self._write_binary_file, filepath, content)
                             downloaded_count += 1
                         else:
                             # 3. 使用 .status_code 属性
@@ -1301,6 +1287,23 @@ class XiaohongshuProvider(BaseProvider):
         except Exception as e:
             logger.error(f"下载笔记图片失败: {e}")
 
+    @staticmethod
+    def _write_binary_file(filepath: str, content: bytes) -> None:
+        """同步写入二进制文件，供 asyncio.to_thread 调用"""
+        with open(filepath, "wb") as f:
+            f.write(content)
+
+    @staticmethod
+    def _write_note_files(directory: str, files: Dict[str, Any]) -> None:
+        """同步创建目录并写入一组文件（str 按文本写入，其余按 JSON 写入），供 asyncio.to_thread 调用"""
+        os.makedirs(directory, exist_ok=True)
+        for filepath, content in files.items():
+            if isinstance(content, str):
+                with open(filepath, "w", encoding="utf-8") as f:
+                    f.write(content)
+            else:
+                write_json_file(filepath, content)
+
     async def close(self):
         """关闭连接（为了接口一致性）"""
         # 小红书爬虫暂无需特殊关闭操作，保留接口以保持一致性
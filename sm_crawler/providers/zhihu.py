@@ -1,17 +1,20 @@
 import os
 import re
-import json
 import asyncio
 import httpx
-from typing import Any, List, Dict
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from ..models import ImageInfo
 from ..providers.base import BaseProvider
 from ..models import ScrapedDataItem
-from ..utils.file_utils import get_file_extension, get_random_user_agent
+from ..utils.browser_utils import HEADLESS_SCRAPE_ARGS, make_route_blocker
+from ..utils.file_utils import filter_cookies_for_url, get_file_extension, get_random_user_agent, write_json_file
+
+# 支持解析的知乎问题页主机名
+_QUESTION_HOSTS = frozenset({"www.zhihu.com", "zhihu.com"})
 
 
 class ZhihuArticleProvider(BaseProvider):
@@ -25,13 +28,15 @@ class ZhihuArticleProvider(BaseProvider):
         config: Any,
         cookies: list | None = None,
         force_save: bool = True,
+        http_client: Optional[httpx.Client] = None,
     ):
-        super().__init__(url, config, force_save, "zhihu")
+        super().__init__(url, config, force_save, "zhihu", http_client)
         self.max_answers = config.max_answers
         self.cookies = cookies
 
     async def fetch_and_parse(self) -> Any:
-        if "www.zhihu.com/question" in self.url:
+        parsed = urlsplit(self.url)
+        if parsed.hostname in _QUESTION_HOSTS and parsed.path.startswith("/question/"):
             return await self._parse_question_page()
         logger.error("❌ 仅支持知乎问题页面的解析")
         raise ValueError("Only Zhihu question pages are supported.")
@@ -41,7 +46,7 @@ class ZhihuArticleProvider(BaseProvider):
 
         def _sync_playwright_parse():
             """同步Playwright解析函数"""
-            from playwright.sync_api import sync_playwright
+            from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
             with sync_playwright() as playwright:
 
@@ -50,7 +55,7 @@ class ZhihuArticleProvider(BaseProvider):
                     headless=True,
                     slow_mo=100,
                     ignore_default_args=["--enable-automation"],
-                    args=["--disable-blink-features=AutomationControlled"],
+                    args=list(HEADLESS_SCRAPE_ARGS),
                 )
 
                 # 2. 创建一个新上下文
@@ -59,17 +64,20 @@ class ZhihuArticleProvider(BaseProvider):
                 # 3. 手动注入 cookies
                 saved_cookies = self.cookies
                 if saved_cookies:
-                    context.add_cookies(saved_cookies)
+                    context.add_cookies(filter_cookies_for_url(saved_cookies, self.url))
                     logger.info("✅ 知乎登录状态已加载")
                 else:
                     logger.warning("⚠️ 未找到 self.cookies，将以未登录状态启动。")
 
+                # 拦截图片/字体/媒体及统计脚本，正文解析不依赖这些资源
+                context.route("**/*", make_route_blocker())
+
                 page = context.new_page()
                 try:
                     logger.debug(f"🌐 正在访问知乎问题页面: {self.url}")
 
                     # 访问页面
-                    page.goto(self.url, timeout=90000, wait_until="networkidle")
+                    page.goto(self.url, timeout=90000, wait_until="domcontentloaded")
                     page.wait_for_selector("h1.QuestionHeader-title", timeout=60000)
                     logger.info("✅ 页面已稳定！")
 
@@ -89,15 +97,23 @@ class ZhihuArticleProvider(BaseProvider):
                         try:
                             page.click(show_all_button_selector, timeout=5000)
                             logger.debug("  - 成功点击 '显示全部' 按钮，等待内容加载...")
-                            page.wait_for_timeout(2000)
                         except Exception as e:
                             logger.warning(f"  - 点击 '显示全部' 按钮失败: {e}")
+                        else:
+                            # 按钮在描述展开后会被移除，直接等待该事件而不是固定睡眠
+                            try:
+                                page.wait_for_selector(show_all_button_selector, state="hidden", timeout=5000)
+                            except PlaywrightTimeoutError:
+                                logger.warning("  - ⚠️ 展开等待超时，按当前页面继续解析...")
                     else:
                         logger.debug("  - 无需展开，问题描述已是全文。")
 
-                    # 等待页面稳定
+                    # 等待首个回答渲染完成
                     logger.debug(f"📝 仅处理页面前 {self.max_answers} 个回答。")
-                    page.wait_for_timeout(1000)
+                    try:
+                        page.wait_for_selector("div.AnswerItem", timeout=10000)
+                    except PlaywrightTimeoutError:
+                        logger.warning("⚠️ 未等到回答加载，按当前页面继续解析...")
 
                     # 获取页面内容
                     final_html = page.content()
@@ -214,8 +230,7 @@ class ZhihuArticleProvider(BaseProvider):
                         }
 
                         json_path = os.path.join(storage_info["article_dir"], "data.json")
-                        with open(json_path, "w", encoding="utf-8") as f:
-                            json.dump(json_data, f, ensure_ascii=False, indent=4)
+                        write_json_file(json_path, json_data)
 
                         self.storage.save_article_index(storage_info, full_content[:200])
 
@@ -246,10 +261,8 @@ class ZhihuArticleProvider(BaseProvider):
                 finally:
                     context.close()
 
-        # 在线程池中执行同步代码
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, _sync_playwright_parse)
+        # 在事件循环的默认线程池中执行同步代码（由 Crawler 注入为共享线程池），并继承当前上下文
+        return await asyncio.to_thread(_sync_playwright_parse)
 
     def _sync_download_question_images(self, question_element, storage_info: dict) -> List[str]:
         """下载问题描述中的图片"""
@@ -267,7 +280,7 @@ class ZhihuArticleProvider(BaseProvider):
                 continue
 
             try:
-                response = httpx.get(img_url, timeout=15)
+                response = self.http.get(img_url, timeout=15)
                 response.raise_for_status()
 
                 # 智能检测图片格式
@@ -309,7 +322,7 @@ class ZhihuArticleProvider(BaseProvider):
                 continue
 
             try:
-                response = httpx.get(img_url, timeout=10)
+                response = self.http.get(img_url, timeout=10)
                 response.raise_for_status()
 
                 # 获取正确的文件扩展名
@@ -5,30 +5,97 @@
 
 import os
 import re
-import json
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
 from datetime import datetime
 from hashlib import md5
-from typing import Dict, TYPE_CHECKING
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 from loguru import logger
 
-from .utils.file_utils import clean_filename, ensure_directory, get_file_extension
+from .utils.file_utils import (
+    clean_filename,
+    ensure_directory,
+    get_file_extension,
+    read_json_file,
+    write_bytes_atomic,
+    write_json_file,
+)
 
 if TYPE_CHECKING:
     from .config import CrawlerConfig
 
+# 当前抓取任务的保存根目录；asyncio 任务与 asyncio.to_thread 会各自继承，互不干扰
+current_base_dir: ContextVar[Optional[str]] = ContextVar("current_base_dir", default=None)
+
+# 同一平台目录的 articles_index.json 可能被并发抓取同时读改写
+_INDEX_LOCK = threading.Lock()
+
+# 最近写入的 JSON 文件缓存（进程内所有 StorageManager 共享）: 路径 -> ((mtime_ns, size), 数据)
+# 文件被外部修改时按 mtime + 大小失效；读取即移出，调用方原地修改后回写时再放回；超出上限时淘汰最久未写的
+_JSON_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_JSON_CACHE_SIZE = 256
+_JSON_CACHE_LOCK = threading.Lock()
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def purge_json_cache(directory: str) -> None:
+    """移除某个目录下所有文件的 JSON 缓存（清理缓存目录时调用）"""
+    prefix = os.path.join(os.path.abspath(directory), "")
+    with _JSON_CACHE_LOCK:
+        for path in [p for p in _JSON_CACHE if os.path.abspath(p).startswith(prefix)]:
+            del _JSON_CACHE[path]
+
 
 class StorageManager:
     def __init__(self, config: "CrawlerConfig"):
         self.config = config
-        self.base_dir = config.download_dir
+        self._base_dir = config.download_dir
         self.platform_dirs = {}
 
+    @property
+    def base_dir(self) -> str:
+        """保存根目录：优先使用当前抓取任务通过 current_base_dir 指定的目录"""
+        return current_base_dir.get() or self._base_dir
+
+    @base_dir.setter
+    def base_dir(self, value: str):
+        self._base_dir = value
+
+    def _load_json(self, path: str, default: Any) -> Any:
+        """读取 JSON 文件，mtime 和大小都未变化时直接复用上次写入的数据"""
+        with _JSON_CACHE_LOCK:
+            # 取出即移除：调用方会原地修改数据，回写时再放回缓存；并发读取同一文件的其他调用方会直接读盘
+            cached = _JSON_CACHE.pop(path, None)
+        try:
+            signature = _file_signature(path)
+        except FileNotFoundError:
+            return default
+
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        return read_json_file(path)
+
+    def _dump_json(self, path: str, data: Any) -> None:
+        """写入 JSON 文件并记录到缓存"""
+        write_json_file(path, data)
+        signature = _file_signature(path)
+        with _JSON_CACHE_LOCK:
+            _JSON_CACHE[path] = (signature, data)
+            _JSON_CACHE.move_to_end(path)
+            if len(_JSON_CACHE) > _JSON_CACHE_SIZE:
+                _JSON_CACHE.popitem(last=False)
+
     def _get_platform_dir(self, platform: str) -> str:
         """获取或创建平台专用目录"""
-        if platform not in self.platform_dirs:
-            platform_dir = ensure_directory(os.path.join(self.base_dir, platform))
-            self.platform_dirs[platform] = platform_dir
-        return self.platform_dirs[platform]
+        key = os.path.join(self.base_dir, platform)
+        if key not in self.platform_dirs:
+            self.platform_dirs[key] = ensure_directory(key)
+        return self.platform_dirs[key]
 
     def _generate_article_id(self, url: str, title: str) -> str:
         """根据URL和标题，生成文章的唯一标识符"""
@@ -39,11 +106,7 @@ class StorageManager:
         """更新元数据文件"""
         metadata_file = storage_info["metadata_file"]
 
-        if os.path.exists(metadata_file):
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
-        else:
-            metadata = {}
+        metadata = self._load_json(metadata_file, {})
 
         # 更新统计信息
         if "statistics" not in metadata:
@@ -58,8 +121,7 @@ class StorageManager:
         metadata["updated_at"] = datetime.now().isoformat()
 
         # 保存更新后的元数据
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        self._dump_json(metadata_file, metadata)
 
     def create_article_storage(self, platform: str, title: str, url: str, author: str | None = None) -> Dict[str, str]:
         """
@@ -118,8 +180,7 @@ class StorageManager:
         }
 
         # 保存元数据
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        self._dump_json(metadata_file, metadata)
 
         logger.info(f"📁 创建存储目录: {article_dir}")
         return storage_info
@@ -128,8 +189,7 @@ class StorageManager:
         """保存纯文本内容"""
         text_file = storage_info["text_file"]
 
-        with open(text_file, "w", encoding="utf-8") as f:
-            f.write(content)
+        write_bytes_atomic(text_file, content.encode("utf-8"))
 
         logger.debug(f"📄 保存文本文件: {os.path.basename(text_file)}")
 
@@ -166,8 +226,7 @@ class StorageManager:
         final_content = re.sub(r"\n{3,}", "\n\n", final_content)
         final_content = re.sub(r"\s{4,}", "   ", final_content)
 
-        with open(markdown_file, "w", encoding="utf-8") as f:
-            f.write(final_content)
+        write_bytes_atomic(markdown_file, final_content.encode("utf-8"))
 
         logger.debug(f"📄 保存Markdown文件: {os.path.basename(markdown_file)}")
 
@@ -224,42 +283,38 @@ class StorageManager:
         platform_dir = self._get_platform_dir(storage_info["platform"])
         index_file = os.path.join(platform_dir, "articles_index.json")
 
-        # 读取现有索引
-        if os.path.exists(index_file):
-            with open(index_file, "r", encoding="utf-8") as f:
-                index_data = json.load(f)
-        else:
-            index_data = {"articles": [], "last_updated": None}
-
-        # 添加新文章到索引
-        article_entry = {
-            "article_id": storage_info["article_id"],
-            "title": storage_info["title"],
-            "safe_title": storage_info["safe_title"],
-            "article_dir": os.path.basename(storage_info["article_dir"]),
-            "created_at": datetime.now().isoformat(),
-            "preview": (content_preview[:200] + "..." if len(content_preview) > 200 else content_preview),
-        }
+        with _INDEX_LOCK:
+            # 读取现有索引
+            index_data = self._load_json(index_file, None) or {"articles": [], "last_updated": None}
+
+            # 添加新文章到索引
+            article_entry = {
+                "article_id": storage_info["article_id"],
+                "title": storage_info["title"],
+                "safe_title": storage_info["safe_title"],
+                "article_dir": os.path.basename(storage_info["article_dir"]),
+                "created_at": datetime.now().isoformat(),
+                "preview": (content_preview[:200] + "..." if len(content_preview) > 200 else content_preview),
+            }
+
+            # 检查是否已存在，如果存在则更新
+            existing_index = None
+            for i, article in enumerate(index_data["articles"]):
+                if article["article_id"] == storage_info["article_id"]:
+                    existing_index = i
+                    break
+
+            if existing_index is not None:
+                index_data["articles"][existing_index] = article_entry
+                logger.debug(f"📋 更新文章索引: {storage_info['title']}")
+            else:
+                index_data["articles"].append(article_entry)
+                logger.debug(f"📋 添加文章到索引: {storage_info['title']}")
+
+            index_data["last_updated"] = datetime.now().isoformat()
+            index_data["total_articles"] = len(index_data["articles"])
 
-        # 检查是否已存在，如果存在则更新
-        existing_index = None
-        for i, article in enumerate(index_data["articles"]):
-            if article["article_id"] == storage_info["article_id"]:
-                existing_index = i
-                break
-
-        if existing_index is not None:
-            index_data["articles"][existing_index] = article_entry
-            logger.debug(f"📋 更新文章索引: {storage_info['title']}")
-        else:
-            index_data["articles"].append(article_entry)
-            logger.debug(f"📋 添加文章到索引: {storage_info['title']}")
-
-        index_data["last_updated"] = datetime.now().isoformat()
-        index_data["total_articles"] = len(index_data["articles"])
-
-        # 保存索引
-        with open(index_file, "w", encoding="utf-8") as f:
-            json.dump(index_data, f, ensure_ascii=False, indent=2)
+            # 保存索引
+            self._dump_json(index_file, index_data)
 
         return index_file
@@ -1,75 +1,193 @@
-from typing import Optional
-from playwright.async_api import async_playwright, BrowserContext
+import asyncio
+import threading
+from typing import Dict, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright
+
+# 无头抓取的精简启动参数：保留反检测开关，关闭后台服务以加快冷启动
+POOLED_SCRAPE_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-extensions",
+    "--no-first-run",
+    "--disable-features=Translate,OptimizationHints",
+)
+
+# 一次性抓取（每次只开一个页面）额外限制为单个渲染进程；共享浏览器不能用，否则并发页面会挤在同一进程里
+HEADLESS_SCRAPE_ARGS = POOLED_SCRAPE_ARGS + ("--renderer-process-limit=1",)
+
+# 抓取时无需真正加载的资源类型：图片/视频均通过 httpx 按 src 单独下载，不依赖浏览器渲染
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# 常见统计/监控脚本域名，与页面正文无关
+_TRACKER_HOSTS = ("google-analytics", "googletagmanager", "sentry.io", "hm.baidu.com", "cnzz.com")
+
+
+def make_route_blocker(resource_types: frozenset = BLOCKED_RESOURCE_TYPES):
+    """
+    生成 sync_api 的路由处理函数，中止指定类型资源和统计脚本的请求
+
+    用法: context.route("**/*", make_route_blocker())
+    """
+
+    def _handler(route) -> None:
+        request = route.request
+        if request.resource_type in resource_types or any(host in request.url for host in _TRACKER_HOSTS):
+            route.abort()
+        else:
+            route.continue_()
+
+    return _handler
+
+
+# 持久化登录浏览器的完整反检测启动参数
+_PERSISTENT_LAUNCH_ARGS = (
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--disable-blink-features=AutomationControlled",
+    "--exclude-switches=enable-automation",
+    "--disable-infobars",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--test-type",
+    "--disable-web-security",
+    "--disable-features=TranslateUI,VizDisplayCompositor",
+    "--use-fake-ui-for-media-stream",
+    "--disable-component-update",
+    "--disable-domain-reliability",
+    "--disable-sync",
+    "--disable-background-networking",
+    "--disable-breakpad",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-client-side-phishing-detection",
+    "--disable-hang-monitor",
+    "--disable-prompt-on-repost",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-ipc-flooding-protection",
+    "--password-store=basic",
+    "--use-mock-keychain",
+)
+_DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+_IGNORE_DEFAULT_ARGS = ("--enable-automation", "--enable-blink-features=AutomationControlled")
+
+# 反检测脚本：挂在 BrowserContext 上，之后该上下文创建的所有页面都会自动注入
+_STEALTH_JS = """
+        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+        delete navigator.__proto__.webdriver;
+        window.navigator.chrome = {runtime: {}, loadTimes: function() {}, csi: function() {}, app: {}};
+        Object.defineProperty(navigator, 'plugins', {get: () => [{name: "Chrome PDF Plugin", filename: "internal-pdf-viewer", description: "Portable Document Format"}]});
+        Object.defineProperty(navigator, 'languages', {get: () => ['zh-CN', 'zh', 'en-US', 'en']});
+        Object.defineProperty(navigator, 'platform', {get: () => 'Win32'});
+        window.document.$cdc_asdjflasutopfhvcZLmcfl_ = undefined;
+        window.document.$chrome_asyncScriptInfo = undefined;
+        const originalQuery = window.navigator.permissions.query;
+        window.navigator.permissions.query = (parameters) => (parameters.name === 'notifications' ? Promise.resolve({ state: Notification.permission }) : originalQuery(parameters));
+        Date.prototype.getTimezoneOffset = function() {return -480;};
+    """
 
 
 async def launch_browser(
     user_data_dir: str,
     headless: bool = False,
     user_agent: Optional[str] = None,
-) -> BrowserContext:
+) -> "BrowserContext":
+    from playwright.async_api import async_playwright
+
     if user_agent is None:
-        user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        user_agent = _DEFAULT_USER_AGENT
 
     p = await async_playwright().start()
     browser = await p.chromium.launch_persistent_context(
         user_data_dir=user_data_dir,
         headless=headless,
-        args=[
-            "--no-sandbox",
-            "--disable-setuid-sandbox",
-            "--disable-dev-shm-usage",
-            "--no-first-run",
-            "--disable-blink-features=AutomationControlled",
-            "--exclude-switches=enable-automation",
-            "--disable-infobars",
-            "--disable-extensions",
-            "--disable-default-apps",
-            "--test-type",
-            "--disable-web-security",
-            "--disable-features=TranslateUI,VizDisplayCompositor",
-            "--use-fake-ui-for-media-stream",
-            "--disable-component-update",
-            "--disable-domain-reliability",
-            "--disable-sync",
-            "--disable-background-networking",
-            "--disable-breakpad",
-            "--disable-component-extensions-with-background-pages",
-            "--disable-client-side-phishing-detection",
-            "--disable-hang-monitor",
-            "--disable-prompt-on-repost",
-            "--disable-background-timer-throttling",
-            "--disable-renderer-backgrounding",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-ipc-flooding-protection",
-            "--password-store=basic",
-            "--use-mock-keychain",
-        ],
+        args=list(_PERSISTENT_LAUNCH_ARGS),
         viewport={"width": 1280, "height": 800},
         user_agent=user_agent,
-        ignore_default_args=["--enable-automation", "--enable-blink-features=AutomationControlled"],
+        ignore_default_args=list(_IGNORE_DEFAULT_ARGS),
         bypass_csp=True,
         locale="zh-CN",
         timezone_id="Asia/Shanghai",
     )
 
-    await browser.add_init_script("""Object.defineProperty(navigator, 'webdriver', {get: () => undefined});""")
+    await browser.add_init_script(_STEALTH_JS)
 
     return browser
 
 
-async def add_stealth_scripts(browser: BrowserContext):
-    await browser.add_init_script(
-        """
-        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-        delete navigator.__proto__.webdriver;
-        window.navigator.chrome = {runtime: {}, loadTimes: function() {}, csi: function() {}, app: {}};
-        Object.defineProperty(navigator, 'plugins', {get: () => [{name: "Chrome PDF Plugin", filename: "internal-pdf-viewer", description: "Portable Document Format"}]});
-        Object.defineProperty(navigator, 'languages', {get: () => ['zh-CN', 'zh', 'en-US', 'en']});
-        Object.defineProperty(navigator, 'platform', {get: () => 'Win32'});
-        window.document.$cdc_asdjflasutopfhvcZLmcfl_ = undefined;
-        window.document.$chrome_asyncScriptInfo = undefined;
-        const originalQuery = window.navigator.permissions.query;
-        window.navigator.permissions.query = (parameters) => (parameters.name === 'notifications' ? Promise.resolve({ state: Notification.permission }) : originalQuery(parameters));
-        Date.prototype.getTimezoneOffset = function() {return -480;};
+async def add_stealth_scripts(browser: "BrowserContext"):
+    await browser.add_init_script(_STEALTH_JS)
+
+
+class _LoopBrowser:
+    """某个事件循环上的 Playwright 驱动、浏览器及其启动锁"""
+
+    def __init__(self):
+        self.playwright: Optional["Playwright"] = None
+        self.browser: Optional["Browser"] = None
+        self.lock = asyncio.Lock()
+
+
+class BrowserPool:
     """
-    )
+    共享的无头 Chromium 实例
+
+    调用方每次从共享浏览器新建 BrowserContext，用完只关闭上下文，避免重复冷启动浏览器。
+    Playwright 对象绑定在创建它的事件循环上，因此按事件循环分别维护浏览器：
+    多个 Crawler（各自的常驻循环）互不影响，close() 只关闭当前循环上的浏览器。
+    """
+
+    def __init__(self, headless: bool = True, args: Sequence[str] = POOLED_SCRAPE_ARGS):
+        self.headless = headless
+        self.args = list(args)
+        self._states: Dict[asyncio.AbstractEventLoop, _LoopBrowser] = {}
+        # 不同循环所在线程会同时访问 _states
+        self._states_lock = threading.Lock()
+
+    def _state(self, create: bool = True) -> Optional[_LoopBrowser]:
+        loop = asyncio.get_running_loop()
+        with self._states_lock:
+            # 已关闭的循环上的连接无法再使用，也无法在其上关闭，只能释放引用
+            for closed_loop in [l for l in self._states if l.is_closed()]:
+                del self._states[closed_loop]
+            state = self._states.get(loop)
+            if state is None and create:
+                state = self._states[loop] = _LoopBrowser()
+        return state
+
+    async def get_browser(self) -> "Browser":
+        """获取（必要时启动）当前事件循环上的共享浏览器"""
+        state = self._state()
+        async with state.lock:
+            if state.browser is None or not state.browser.is_connected():
+                if state.playwright is None:
+                    from playwright.async_api import async_playwright
+
+                    state.playwright = await async_playwright().start()
+                state.browser = await state.playwright.chromium.launch(headless=self.headless, args=self.args)
+            return state.browser
+
+    async def close(self):
+        """关闭当前事件循环上的共享浏览器和 Playwright 驱动"""
+        state = self._state(create=False)
+        if state is None:
+            return
+        async with state.lock:
+            with self._states_lock:
+                self._states.pop(asyncio.get_running_loop(), None)
+            try:
+                if state.browser is not None:
+                    await state.browser.close()
+            finally:
+                if state.playwright is not None:
+                    await state.playwright.stop()
+
+
+browser_pool = BrowserPool()
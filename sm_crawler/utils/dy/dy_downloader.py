@@ -9,6 +9,15 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from loguru import logger
 
+# 短链接域名，需要跟随重定向才能拿到真实地址
+_SHORT_LINK_HOSTS = ("v.douyin.com", "iesdouyin.com")
+
+_VIDEO_ID_RE = re.compile(r"/video/(\d+)")
+_USER_ID_RE = re.compile(r"/user/([^/\?]+)")
+_MODAL_ID_RE = re.compile(r"modal_id=(\d+)")
+_AUTHOR_SEC_ID_RE = re.compile(r'"authorSecId"\s*:\s*"([^"]+)"')
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 class DouyinVideoDownloader:
     """抖音视频下载器"""
@@ -33,7 +42,7 @@ class DouyinVideoDownloader:
         logger.debug(f"🔍 正在解析链接...")
 
         try:
-            if "v.douyin.com" in share_url or "iesdouyin.com" in share_url:
+            if any(host in share_url for host in _SHORT_LINK_HOSTS):
                 async with httpx.AsyncClient(follow_redirects=True, timeout=10) as client:
                     response = await client.get(share_url)
                     share_url = str(response.url)
@@ -41,16 +50,16 @@ class DouyinVideoDownloader:
             aweme_id = None
             sec_user_id = None
 
-            video_match = re.search(r"/video/(\d+)", share_url)
+            video_match = _VIDEO_ID_RE.search(share_url)
             if video_match:
                 aweme_id = video_match.group(1)
 
-            user_match = re.search(r"/user/([^/\?]+)", share_url)
+            user_match = _USER_ID_RE.search(share_url)
             if user_match:
                 sec_user_id = user_match.group(1)
 
             if not aweme_id:
-                modal_match = re.search(r"modal_id=(\d+)", share_url)
+                modal_match = _MODAL_ID_RE.search(share_url)
                 if modal_match:
                     aweme_id = modal_match.group(1)
 
@@ -73,12 +82,12 @@ class DouyinVideoDownloader:
             video_url = f"https://www.douyin.com/video/{aweme_id}"
             response = await self.client.get(video_url, follow_redirects=True)
 
-            user_match = re.search(r"/user/([^/\?]+)", str(response.url))
+            user_match = _USER_ID_RE.search(str(response.url))
             if user_match:
                 return user_match.group(1)
 
             html = response.text
-            sec_id_match = re.search(r'"authorSecId"\s*:\s*"([^"]+)"', html)
+            sec_id_match = _AUTHOR_SEC_ID_RE.search(html)
             if sec_id_match:
                 return sec_id_match.group(1)
 
@@ -195,15 +204,18 @@ class DouyinVideoDownloader:
 
                     total_size = int(response.headers.get("content-length", 0))
                     downloaded = 0
+                    # 每跨过 10% 才输出一次进度，避免每个分块都格式化日志
+                    next_report = total_size // 10
 
                     with open(save_path, "wb") as f:
                         async for chunk in response.aiter_bytes(chunk_size=1024 * 1024):
-                            f.write(chunk)
+                            # 分块写盘放到线程池，大文件写入时不阻塞其他并发抓取
+                            await asyncio.to_thread(f.write, chunk)
                             downloaded += len(chunk)
 
-                            if total_size > 0:
-                                progress = (downloaded / total_size) * 100
-                                logger.debug(f"进度: {progress:.1f}%")
+                            if total_size > 0 and downloaded >= next_report:
+                                logger.debug(f"进度: {downloaded * 100 / total_size:.1f}%")
+                                next_report += total_size // 10 or total_size
 
             logger.info(f"✅ 下载完成! 保存路径: {save_path}")
             return True
@@ -238,8 +250,8 @@ class DouyinVideoDownloader:
 
         author_name = video_info["author"]["nickname"]
         desc = video_info["desc"][:30]
-        safe_author = re.sub(r'[<>:"/\\|?*]', "_", author_name)
-        safe_desc = re.sub(r'[<>:"/\\|?*]', "_", desc)
+        safe_author = _UNSAFE_FILENAME_RE.sub("_", author_name)
+        safe_desc = _UNSAFE_FILENAME_RE.sub("_", desc)
 
         filename = f"{safe_author}_{aweme_id}_{safe_desc}.mp4"
         save_path = str(Path(save_dir) / filename)
@@ -4,11 +4,19 @@
 
 import os
 import re
+import json
+import uuid
 import filetype
 from fake_useragent import UserAgent
-from typing import Optional
+from typing import Any, Optional, List
+from urllib.parse import urlsplit
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选加速依赖，缺失时回退到标准库
+    orjson = None
+
 
 def clean_filename(filename: str, max_length: int = 80) -> str:
     """
@@ -54,6 +62,44 @@ def ensure_directory(directory: str) -> str:
     return abs_path
 
 
+def dumps_json(data: Any) -> bytes:
+    """将数据序列化为缩进 2 格、保留非 ASCII 字符的 UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def read_json_file(path: str) -> Any:
+    """读取 JSON 文件"""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    """先写入同目录临时文件再 os.replace 覆盖，避免中途崩溃留下半截文件"""
+    # 临时文件名唯一，同一目标文件被并发写入时互不干扰；按 0666 创建再受 umask 约束，
+    # 替换后的权限与直接 open() 写入一致（mkstemp 固定为 0600）
+    directory, basename = os.path.split(path)
+    tmp_path = os.path.join(directory, f".{basename}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_json_file(path: str, data: Any) -> None:
+    """原子写入 JSON 文件"""
+    write_bytes_atomic(path, dumps_json(data))
+
+
 def get_file_extension(
     content: Optional[bytes] = None,
 ) -> str:
@@ -79,7 +125,7 @@ def format_cookies_to_string(cookies):
 
     # 1. 检查输入是否已经是字符串
     if isinstance(cookies, str):
-        logger.info("输入已经是字符串，直接返回。")
+        logger.debug("输入已经是字符串，直接返回。")
         return cookies
 
     # 2. 检查输入是否是列表
@@ -103,6 +149,27 @@ def format_cookies_to_string(cookies):
         return ""
 
 
+def filter_cookies_for_url(cookies: List[dict], url: str) -> List[dict]:
+    """
+    只保留与目标URL同一主域名的 cookies，减少注入浏览器上下文的数量
+
+    未设置 domain 的 cookie（使用 url 字段）原样保留。
+    """
+    host = urlsplit(url).hostname or ""
+    if not host:
+        return cookies
+
+    # 取主域名（如 s.weibo.com -> weibo.com），兼容登录跳转到同站其他子域名
+    base_domain = ".".join(host.split(".")[-2:])
+
+    filtered = []
+    for cookie in cookies:
+        domain = cookie.get("domain", "").lstrip(".").lower()
+        if not domain or domain == base_domain or domain.endswith("." + base_domain):
+            filtered.append(cookie)
+    return filtered
+
+
 def get_random_user_agent(browser_type="chrome") -> str:
     """
     生成一个随机的、真实的 **桌面** User-Agent。
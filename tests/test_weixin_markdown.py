@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("playwright")
+
+from bs4 import BeautifulSoup
+
+from sm_crawler.providers.weixin import WeixinMpProvider
+
+
+def _provider_without_init() -> WeixinMpProvider:
+    """只测试 Markdown 转换，不需要配置和存储"""
+    provider = WeixinMpProvider.__new__(WeixinMpProvider)
+    provider.img_counter = 0
+    return provider
+
+
+def test_nested_section_images_are_numbered_in_document_order():
+    html = '<section><section><img data-src="https://a/A.png"></section><img data-src="https://a/B.png"></section>'
+    tag = BeautifulSoup(html, "html.parser").section
+    provider = _provider_without_init()
+
+    downloaded = []
+
+    def fake_download_image(img_url, save_dir):
+        provider.img_counter += 1
+        downloaded.append((img_url, provider.img_counter))
+        return f"image_{provider.img_counter}.png"
+
+    provider.download_image = fake_download_image
+
+    markdown = provider.convert_tag_to_markdown(tag, "save_dir")
+
+    assert downloaded == [("https://a/A.png", 1), ("https://a/B.png", 2)]
+    assert markdown.index("image_1.png") < markdown.index("image_2.png")